@@ -143,7 +143,7 @@ describe('Standalone Mode Integration Tests', () => {
       status = await generator.checkStandaloneSetup();
       expect(status.hasConfig).toBe(true);
       expect(status.isStandalone).toBe(true);
-      expect(status.messages.some(msg => msg.includes('.env.local found'))).toBe(true);
+      expect(status.messages.join('\n')).toContain('.env.local found');
       expect(status.messages).toContain('Environment configured for standalone mode');
     });
   });
@@ -250,6 +250,18 @@ describe('Standalone Mode Integration Tests', () => {
       expect(memoryCache.removeConnection(sessionId, connectionId1)).toBe(true);
     });
 
+    it('should track memory usage as connections are added and removed', () => {
+      const sessionId = 'test-session-memory';
+      memoryCache.set(sessionId, { data: 'test' }, undefined, 'test-project', 'conn-1');
+      const baseline = memoryCache.getStats().memoryUsage;
+
+      memoryCache.addConnection(sessionId, 'conn-with-a-longer-identifier');
+      expect(memoryCache.getStats().memoryUsage).toBeGreaterThan(baseline);
+
+      memoryCache.removeConnection(sessionId, 'conn-with-a-longer-identifier');
+      expect(memoryCache.getStats().memoryUsage).toBe(baseline);
+    });
+
     it('should perform LRU eviction when memory limits are reached', () => {
       // Fill cache beyond maxEntries
       for (let i = 0; i < 150; i++) {
@@ -27,6 +27,15 @@ describe('JSONLFileSystemMonitor', () => {
   let mockWatcher: jest.Mocked<chokidar.FSWatcher>;
   let tempDir: string;
 
+  // The monitor only uses this as a path (fs is mocked), so one per file is enough
+  beforeAll(() => {
+    tempDir = (global as any).testUtils.createTempDir();
+  });
+
+  afterAll(() => {
+    (global as any).testUtils.cleanupTempDir(tempDir);
+  });
+
   beforeEach(() => {
     // Reset all mocks
     jest.clearAllMocks();
@@ -42,9 +51,6 @@ describe('JSONLFileSystemMonitor', () => {
 
     mockChokidar.watch.mockReturnValue(mockWatcher);
     
-    // Setup temporary directory
-    tempDir = (global as any).testUtils.createTempDir();
-    
     // Initialize monitor with test configuration
     monitor = new JSONLFileSystemMonitor({
       claudeProjectsDir: tempDir,
@@ -56,7 +62,6 @@ describe('JSONLFileSystemMonitor', () => {
 
   afterEach(async () => {
     await monitor.shutdown();
-    (global as any).testUtils.cleanupTempDir(tempDir);
   });
 
   describe('Initialization', () => {
@@ -359,6 +364,93 @@ describe('JSONLFileSystemMonitor', () => {
       await eventPromise;
     });
 
+    it('should reuse the file handle across changes and close it on delete', async () => {
+      const filePath = path.join(tempDir, '-test-project', 'session-123.jsonl');
+
+      mockFs.stat.mockResolvedValue((global as any).testUtils.createMockStats(100));
+      const addHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'add')?.[1];
+      await addHandler(filePath);
+
+      const line = SAMPLE_JSONL_ENTRIES[0] + '\n';
+      const mockFileHandle = {
+        read: jest.fn().mockResolvedValue({ bytesRead: line.length }),
+        close: jest.fn().mockResolvedValue(undefined)
+      };
+      mockFs.open.mockResolvedValue(mockFileHandle as any);
+
+      const changeHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'change')?.[1];
+      mockFs.stat.mockResolvedValue((global as any).testUtils.createMockStats(100 + line.length));
+      await changeHandler(filePath);
+      mockFs.stat.mockResolvedValue((global as any).testUtils.createMockStats(100 + line.length * 2));
+      await changeHandler(filePath);
+
+      expect(mockFs.open).toHaveBeenCalledTimes(1);
+      expect(mockFileHandle.read).toHaveBeenCalledTimes(2);
+      expect(mockFileHandle.close).not.toHaveBeenCalled();
+
+      const unlinkHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'unlink')?.[1];
+      await unlinkHandler(filePath);
+
+      expect(mockFileHandle.close).toHaveBeenCalledTimes(1);
+    });
+
+    it('should open the file once when change events overlap', async () => {
+      const filePath = path.join(tempDir, '-test-project', 'session-123.jsonl');
+
+      mockFs.stat.mockResolvedValue((global as any).testUtils.createMockStats(100));
+      const addHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'add')?.[1];
+      await addHandler(filePath);
+
+      const line = SAMPLE_JSONL_ENTRIES[0] + '\n';
+      const mockFileHandle = {
+        read: jest.fn().mockResolvedValue({ bytesRead: line.length }),
+        close: jest.fn().mockResolvedValue(undefined)
+      };
+      mockFs.open.mockImplementation(() => new Promise(resolve => {
+        setTimeout(() => resolve(mockFileHandle as any), 10);
+      }));
+
+      const changeHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'change')?.[1];
+      mockFs.stat.mockResolvedValue((global as any).testUtils.createMockStats(100 + line.length));
+      await Promise.all([changeHandler(filePath), changeHandler(filePath)]);
+
+      expect(mockFs.open).toHaveBeenCalledTimes(1);
+      expect(mockFileHandle.close).not.toHaveBeenCalled();
+    });
+
+    it('should reopen the file handle when the file is replaced', async () => {
+      const filePath = path.join(tempDir, '-test-project', 'session-123.jsonl');
+      const createStats = (size: number, ino: number) =>
+        ({ ...(global as any).testUtils.createMockStats(size), ino });
+
+      mockFs.stat.mockResolvedValue(createStats(100, 1));
+      const addHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'add')?.[1];
+      await addHandler(filePath);
+
+      const line = SAMPLE_JSONL_ENTRIES[0] + '\n';
+      const firstHandle = {
+        read: jest.fn().mockResolvedValue({ bytesRead: line.length }),
+        close: jest.fn().mockResolvedValue(undefined)
+      };
+      const secondHandle = {
+        read: jest.fn().mockResolvedValue({ bytesRead: line.length }),
+        close: jest.fn().mockResolvedValue(undefined)
+      };
+      mockFs.open
+        .mockResolvedValueOnce(firstHandle as any)
+        .mockResolvedValueOnce(secondHandle as any);
+
+      const changeHandler = mockWatcher.on.mock.calls.find(call => call[0] === 'change')?.[1];
+      mockFs.stat.mockResolvedValue(createStats(100 + line.length, 1));
+      await changeHandler(filePath);
+      mockFs.stat.mockResolvedValue(createStats(line.length, 2));
+      await changeHandler(filePath);
+
+      expect(firstHandle.close).toHaveBeenCalledTimes(1);
+      expect(mockFs.open).toHaveBeenCalledTimes(2);
+      expect(secondHandle.read).toHaveBeenCalledWith(expect.any(Buffer), 0, line.length, 0);
+    });
+
     it('should validate session IDs correctly', () => {
       const validSessionId = '123e4567-e89b-12d3-a456-426614174000';
       const invalidSessionId = 'not-a-uuid';
@@ -0,0 +1,88 @@
+/**
+ * Unit tests for Recovery Action Service
+ *
+ * Tests cover:
+ * - Cancelling retries when the service shuts down mid-attempt
+ * - Waking a pending retry backoff on shutdown
+ */
+
+import {
+  RecoveryActionService,
+  RecoveryActionType,
+  RecoveryExecution,
+  RecoveryResult,
+  ClaudeCodeClient
+} from '../../src/lib/services/recovery-actions';
+
+describe('RecoveryActionService retry shutdown', () => {
+  let service: RecoveryActionService;
+  let execution: RecoveryExecution;
+  let attemptSpy: jest.SpyInstance;
+
+  beforeEach(() => {
+    const client: ClaudeCodeClient = {
+      sendCommand: jest.fn().mockResolvedValue({ success: true }),
+      sendInput: jest.fn().mockResolvedValue({ success: true }),
+      sendEnter: jest.fn().mockResolvedValue({ success: true }),
+      sendKeypress: jest.fn().mockResolvedValue({ success: true }),
+      isConnected: jest.fn().mockReturnValue(true),
+      connect: jest.fn().mockResolvedValue(true),
+      disconnect: jest.fn()
+    };
+    service = new RecoveryActionService(client);
+
+    execution = {
+      action: {
+        actionType: RecoveryActionType.CLEAR_ERROR,
+        targetState: 'idle',
+        priority: 5,
+        timeout: 1,
+        maxRetries: 3,
+        requiresConfirmation: false,
+        description: 'Test action'
+      },
+      execId: 'test0001',
+      contextTag: 'exec:test0001',
+      startTime: new Date(),
+      attempts: 0,
+      metadata: {}
+    };
+
+    // Full jitter picks the top of the backoff window, a 2s wait
+    jest.spyOn(Math, 'random').mockReturnValue(1);
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+    jest.spyOn(console, 'info').mockImplementation(() => {});
+    attemptSpy = jest.spyOn(service as any, 'executeSingleAttempt');
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should cancel without backing off when shutdown runs during an attempt', async () => {
+    attemptSpy.mockImplementation(async () => {
+      void service.shutdown();
+      return false;
+    });
+
+    const started = Date.now();
+    const result = await (service as any).executeWithRetry(execution);
+
+    expect(result).toBe(RecoveryResult.CANCELLED);
+    expect(attemptSpy).toHaveBeenCalledTimes(1);
+    expect(Date.now() - started).toBeLessThan(1000);
+  });
+
+  it('should cancel a pending backoff when shutdown runs', async () => {
+    attemptSpy.mockResolvedValue(false);
+
+    const started = Date.now();
+    const resultPromise = (service as any).executeWithRetry(execution);
+    await new Promise(resolve => setImmediate(resolve));
+    await service.shutdown();
+
+    expect(await resultPromise).toBe(RecoveryResult.CANCELLED);
+    expect(attemptSpy).toHaveBeenCalledTimes(1);
+    expect(Date.now() - started).toBeLessThan(1000);
+  });
+});
@@ -77,6 +77,12 @@ describe('TTYBridge', () => {
     // Mock socket
     mockSocket = {
       write: jest.fn(),
+      cork: jest.fn(() => { mockSocket.writableCorked++; }),
+      uncork: jest.fn(() => { mockSocket.writableCorked--; }),
+      writableCorked: 0,
+      setNoDelay: jest.fn(),
+      setKeepAlive: jest.fn(),
+      setEncoding: jest.fn(),
       end: jest.fn(),
       on: jest.fn().mockReturnThis(),
       emit: jest.fn(),
@@ -87,10 +93,12 @@ describe('TTYBridge', () => {
     // Mock Claude process
     mockClaudeProcess = {
       stdout: {
-        on: jest.fn().mockReturnThis()
+        on: jest.fn().mockReturnThis(),
+        setEncoding: jest.fn().mockReturnThis()
       },
       stderr: {
-        on: jest.fn().mockReturnThis()
+        on: jest.fn().mockReturnThis(),
+        setEncoding: jest.fn().mockReturnThis()
       },
       stdin: {
         write: jest.fn()
@@ -252,6 +260,8 @@ describe('TTYBridge', () => {
       }
       
       expect(clientConnectedSpy).toHaveBeenCalledWith(mockSocket);
+      expect(mockSocket.setNoDelay).toHaveBeenCalledWith(true);
+      expect(mockSocket.setKeepAlive).toHaveBeenCalledWith(true, 10000);
     });
 
     it('should handle client disconnections', () => {
@@ -291,6 +301,70 @@ describe('TTYBridge', () => {
       // Should not throw, just handle gracefully
       expect(mockSocket.end).not.toHaveBeenCalled(); // Error handling shouldn't end socket
     });
+
+    it('should run each command in a batched write and cork the replies', async () => {
+      mockServer.connectionHandler(mockSocket);
+      const dataHandler = (mockSocket.on as jest.Mock).mock.calls.find(
+        (call: any[]) => call[0] === 'data'
+      )?.[1];
+
+      const frame = (content: string) => JSON.stringify({
+        type: 'send',
+        content,
+        instanceId: mockOptions.instanceId
+      });
+      dataHandler(frame('first') + '\n' + frame('second') + '\n');
+      await new Promise(resolve => setImmediate(resolve));
+
+      expect(mockClaudeProcess.stdin.write).toHaveBeenNthCalledWith(1, 'first');
+      expect(mockClaudeProcess.stdin.write).toHaveBeenNthCalledWith(2, 'second');
+      expect(mockSocket.write).toHaveBeenCalledTimes(2);
+      expect(mockSocket.cork).toHaveBeenCalledTimes(1);
+      expect(mockSocket.writableCorked).toBe(0);
+    });
+
+    it('should refuse commands once the client queue is full', async () => {
+      mockServer.connectionHandler(mockSocket);
+      const dataHandler = (mockSocket.on as jest.Mock).mock.calls.find(
+        (call: any[]) => call[0] === 'data'
+      )?.[1];
+
+      const sequenceId = '550e8400-e29b-41d4-a716-446655440006';
+      const frame = JSON.stringify({
+        type: 'sleep',
+        content: '1000',
+        instanceId: mockOptions.instanceId,
+        sequenceId
+      });
+      dataHandler((frame + '\n').repeat(101));
+
+      expect(mockSocket.write).toHaveBeenCalledTimes(1);
+      const response = JSON.parse((mockSocket.write as jest.Mock).mock.calls[0][0]);
+      expect(response).toMatchObject({ success: false, message: 'Command queue full', sequenceId });
+    });
+
+    it('should reassemble a command split across reads', async () => {
+      mockServer.connectionHandler(mockSocket);
+      const dataHandler = (mockSocket.on as jest.Mock).mock.calls.find(
+        (call: any[]) => call[0] === 'data'
+      )?.[1];
+
+      const frame = JSON.stringify({
+        type: 'send',
+        content: 'héllo',
+        instanceId: mockOptions.instanceId
+      }) + '\n';
+      dataHandler(frame.slice(0, 20));
+      await new Promise(resolve => setImmediate(resolve));
+      expect(mockSocket.write).not.toHaveBeenCalled();
+
+      dataHandler(frame.slice(20));
+      await new Promise(resolve => setImmediate(resolve));
+
+      expect(mockSocket.setEncoding).toHaveBeenCalledWith('utf8');
+      expect(mockClaudeProcess.stdin.write).toHaveBeenCalledWith('héllo');
+      expect(mockSocket.write).toHaveBeenCalledTimes(1);
+    });
   });
 
   describe('Command Processing', () => {
@@ -329,6 +403,21 @@ describe('TTYBridge', () => {
       expect(mockClaudeProcess.stdin.write).toHaveBeenCalledWith('test message');
     });
 
+    it('should execute submit command as a single write', async () => {
+      const command: TCPCommand = {
+        type: 'submit',
+        content: 'test message',
+        instanceId: mockOptions.instanceId,
+        timestamp: new Date()
+      };
+      
+      const response = await bridge.sendCommand(command);
+      
+      expect(response.success).toBe(true);
+      expect(mockClaudeProcess.stdin.write).toHaveBeenCalledTimes(1);
+      expect(mockClaudeProcess.stdin.write).toHaveBeenCalledWith('test message\n');
+    });
+
     it('should execute special key commands correctly', async () => {
       const testCases = [
         { type: 'enter' as const, expectedInput: '\n' },
@@ -372,6 +461,27 @@ describe('TTYBridge', () => {
       expect(mockClaudeProcess.stdin.write).not.toHaveBeenCalled();
     });
 
+    it('should pace sleep command on the bridge without sending input', async () => {
+      const command: TCPCommand = {
+        type: 'sleep',
+        content: '10',
+        instanceId: mockOptions.instanceId,
+        timestamp: new Date(),
+        sequenceId: '550e8400-e29b-41d4-a716-446655440004'
+      };
+      
+      const response = await bridge.sendCommand(command);
+      
+      expect(response).toEqual({
+        success: true,
+        message: 'Slept 10ms',
+        timestamp: expect.any(Date),
+        sequenceId: command.sequenceId
+      });
+      
+      expect(mockClaudeProcess.stdin.write).not.toHaveBeenCalled();
+    });
+
     it('should handle status command correctly', async () => {
       const command: TCPCommand = {
         type: 'status',
@@ -446,9 +556,10 @@ describe('TTYBridge', () => {
         (call: any[]) => call[0] === 'data'
       )?.[1];
       if (dataHandler) {
-        dataHandler(Buffer.from('Claude output'));
+        dataHandler('Claude output');
       }
       
+      expect(mockClaudeProcess.stdout.setEncoding).toHaveBeenCalledWith('utf8');
       expect(outputSpy).toHaveBeenCalledWith('Claude output');
     });
 
@@ -463,7 +574,7 @@ describe('TTYBridge', () => {
         (call: any[]) => call[0] === 'data'
       )?.[1];
       if (errorHandler) {
-        errorHandler(Buffer.from('Claude error'));
+        errorHandler('Claude error');
       }
       
       expect(errorSpy).toHaveBeenCalledWith('Claude error');
@@ -571,6 +682,36 @@ describe('TTYBridge', () => {
       jest.useRealTimers();
     });
 
+    it('should not signal a Claude process that has already exited', async () => {
+      await bridge.start();
+      (mockClaudeProcess as any).exitCode = 0;
+
+      await bridge.stop();
+
+      expect(mockClaudeProcess.kill).not.toHaveBeenCalled();
+    });
+
+    it('should reject pending sleep commands on shutdown', async () => {
+      await bridge.start();
+      (mockClaudeProcess as any).exitCode = 0;
+      const executedHandler = jest.fn();
+      bridge.on('command_executed', executedHandler);
+
+      const sleepPromise = bridge.sendCommand({
+        type: 'sleep',
+        content: '50',
+        instanceId: mockOptions.instanceId,
+        timestamp: new Date(),
+        sequenceId: '550e8400-e29b-41d4-a716-446655440005'
+      });
+      const rejection = expect(sleepPromise).rejects.toThrow('Bridge stopped');
+      await bridge.stop();
+
+      await rejection;
+      await new Promise(resolve => setTimeout(resolve, 100));
+      expect(executedHandler).not.toHaveBeenCalled();
+    });
+
     it('should close all client connections on shutdown', async () => {
       await bridge.start();
       
@@ -641,7 +782,9 @@ describe('TTY Bridge Factory Functions', () => {
         }),
         on: jest.fn((event: string, handler: any) => {
           if (event === 'error') {
-            setTimeout(() => handler(new Error('Port in use')), 0);
+            const error: NodeJS.ErrnoException = new Error('Port in use');
+            error.code = 'EADDRINUSE';
+            setTimeout(() => handler(error), 0);
           }
           return mockTestServer;
         })
@@ -649,7 +792,28 @@ describe('TTY Bridge Factory Functions', () => {
       
       mockedNet.createServer.mockReturnValue(mockTestServer as any);
       
-      await expect(findAvailablePort(9999, 9999)).rejects.toThrow();
+      await expect(findAvailablePort(9999, 10001)).rejects.toThrow();
+      expect(mockTestServer.listen).toHaveBeenCalledTimes(3);
+    });
+
+    it('should reject on an unexpected listen error without scanning further', async () => {
+      const listenError: NodeJS.ErrnoException = new Error('Cannot assign requested address');
+      listenError.code = 'EADDRNOTAVAIL';
+      const mockTestServer = {
+        listen: jest.fn(() => mockTestServer),
+        close: jest.fn(() => mockTestServer),
+        on: jest.fn((event: string, handler: any) => {
+          if (event === 'error') {
+            setTimeout(() => handler(listenError), 0);
+          }
+          return mockTestServer;
+        })
+      };
+
+      mockedNet.createServer.mockReturnValue(mockTestServer as any);
+
+      await expect(findAvailablePort(9999, 10001)).rejects.toBe(listenError);
+      expect(mockTestServer.listen).toHaveBeenCalledTimes(1);
     });
   });
 });
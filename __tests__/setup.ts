@@ -36,6 +36,7 @@ jest.mock('pino', () => {
     warn: jest.fn(),
     debug: jest.fn(),
     child: jest.fn(() => mockLogger),
+    isLevelEnabled: jest.fn(() => true),
   };
   
   const pinoMock = jest.fn(() => mockLogger);
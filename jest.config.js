@@ -6,6 +6,8 @@ module.exports = {
     '**/__tests__/**/*.test.(ts|tsx|js|jsx)',
     '**/?(*.)+(spec|test).(ts|tsx|js|jsx)'
   ],
+  // Playwright specs run under `npm run e2e`; skip importing them during jest collection
+  testPathIgnorePatterns: ['/node_modules/', '<rootDir>/tests/e2e/'],
   transform: {
     '^.+\\.(ts|tsx)$': ['ts-jest', {
       useESM: false,
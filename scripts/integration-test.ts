@@ -10,6 +10,9 @@
 import * as fs from 'fs/promises';
 import * as path from 'path';
 
+/** Horizontal rule printed around report sections */
+const SECTION_RULE = '='.repeat(50);
+
 interface IntegrationTestResult {
   category: string;
   tests: {
@@ -25,7 +28,7 @@ class IntegrationTester {
 
   async runAllTests(): Promise<void> {
     console.log('🧪 Running Final Integration Tests');
-    console.log('=' .repeat(50));
+    console.log(SECTION_RULE);
 
     await this.testPerformanceOptimizations();
     await this.testVirtualization();
@@ -204,9 +207,9 @@ class IntegrationTester {
   }
 
   private printSummary(): void {
-    console.log('\n' + '=' .repeat(50));
+    console.log('\n' + SECTION_RULE);
     console.log('📊 INTEGRATION TEST SUMMARY');
-    console.log('=' .repeat(50));
+    console.log(SECTION_RULE);
 
     let totalTests = 0;
     let passedTests = 0;
@@ -234,9 +237,9 @@ class IntegrationTester {
       }
     }
 
-    console.log('\n' + '=' .repeat(50));
+    console.log('\n' + SECTION_RULE);
     console.log('🏆 FINAL RESULTS');
-    console.log('=' .repeat(50));
+    console.log(SECTION_RULE);
     console.log(`Tests Passed: ${passedTests}/${totalTests} (${(passedTests/totalTests*100).toFixed(1)}%)`);
     console.log(`Benchmarks Met: ${benchmarksMetCount}/${totalTests} (${(benchmarksMetCount/totalTests*100).toFixed(1)}%)`);
 
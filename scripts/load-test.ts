@@ -17,6 +17,9 @@ import { performance } from 'perf_hooks';
 import * as http from 'http';
 import * as https from 'https';
 
+/** Horizontal rule printed around report sections */
+const SECTION_RULE = '='.repeat(60);
+
 interface LoadTestConfig {
   baseUrl: string;
   duration: number; // seconds
@@ -190,7 +193,7 @@ class LoadTester {
 
   async runFullLoadTest(): Promise<TestSummary> {
     console.log('🔥 Starting Comprehensive Load Test for Claude Monitor');
-    console.log('=' .repeat(60));
+    console.log(SECTION_RULE);
 
     const results: LoadTestResult[] = [];
 
@@ -231,9 +234,9 @@ class LoadTester {
   }
 
   private logOverallResults(summary: TestSummary): void {
-    console.log('\n' + '=' .repeat(60));
+    console.log('\n' + SECTION_RULE);
     console.log('🏆 OVERALL LOAD TEST RESULTS');
-    console.log('=' .repeat(60));
+    console.log(SECTION_RULE);
     
     const { overallStats } = summary;
     console.log(`Total Requests: ${overallStats.totalRequests}`);
@@ -71,7 +71,7 @@ const CommandRequestSchema = z.object({
 
 // Command whitelist for security
 const ALLOWED_COMMANDS = new Set([
-  'send', 'enter', 'up', 'down', 'ctrl-c', 'tab', 'raw', 'status', 'ping'
+  'send', 'enter', 'up', 'down', 'ctrl-c', 'tab', 'raw', 'status', 'ping', 'sleep', 'submit'
 ]);
 
 // Forbidden command patterns
@@ -86,6 +86,10 @@ const FORBIDDEN_PATTERNS = [
   /exec/i
 ];
 
+// The rules above compiled once into a single alternation, so content is
+// scanned in one regex pass instead of one pass per rule
+const FORBIDDEN_PATTERN = new RegExp(FORBIDDEN_PATTERNS.map(p => `(?:${p.source})`).join('|'), 'i');
+
 /**
  * Check rate limiting for client
  */
@@ -153,13 +157,11 @@ function validateCommandSecurity(command: TCPCommand): { valid: boolean; reason?
 
   // Check for forbidden patterns in content
   if (command.content) {
-    for (const pattern of FORBIDDEN_PATTERNS) {
-      if (pattern.test(command.content)) {
-        return { 
-          valid: false, 
-          reason: 'Command contains forbidden pattern' 
-        };
-      }
+    if (FORBIDDEN_PATTERN.test(command.content)) {
+      return { 
+        valid: false, 
+        reason: 'Command contains forbidden pattern' 
+      };
     }
 
     // Additional security checks
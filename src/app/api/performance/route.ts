@@ -29,10 +29,10 @@ async function GET(request: NextRequest) {
       });
 
     case 'report':
-      const report = await performanceMonitor.generatePerformanceReport();
+      const report = await performanceMonitor.buildPerformanceReport();
       return NextResponse.json({
         success: true,
-        data: JSON.parse(report)
+        data: report
       });
 
     default:
@@ -41,7 +41,7 @@ async function GET(request: NextRequest) {
         data: {
           current: performanceMonitor.getCurrentMetrics(),
           benchmarks: performanceMonitor.compareToPythonBenchmarks(),
-          uptime: Date.now() - (performanceMonitor as any).startTime
+          uptime: performanceMonitor.getUptimeMs()
         }
       });
   }
@@ -66,10 +66,10 @@ async function POST(request: NextRequest) {
       });
 
     case 'generate_report':
-      const report = await performanceMonitor.generatePerformanceReport();
+      const report = await performanceMonitor.buildPerformanceReport();
       return NextResponse.json({
         success: true,
-        data: JSON.parse(report),
+        data: report,
         message: 'Performance report generated'
       });
 
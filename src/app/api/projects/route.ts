@@ -106,29 +106,32 @@ async function GET_HANDLER(request: NextRequest) {
       }
     });
 
-    // Transform data for response (optimized)
-    const projectsData = projects.map(project => ({
-      id: project.id,
-      projectPath: project.projectPath,
-      displayName: project.displayName,
-      encodedPath: project.encodedPath,
-      monitoring: project.monitoring,
-      currentState: project.currentState,
-      lastActivity: project.lastActivity,
-      recoverySettings: project.recoverySettings,
-      sessionCount: project.sessions.length,
-      activeSessions: project.sessions.filter(s => s.isActive).length,
-      totalEvents: project.sessions.reduce((sum, s) => sum + (s.eventCount || 0), 0),
-      createdAt: project.createdAt,
-      updatedAt: project.updatedAt
-    }));
+    // Transform data for response (optimized): spread the selected columns
+    // and fold the session aggregates into a single pass per project
+    let activeProjects = 0;
+    const projectsData = projects.map(({ sessions, ...project }) => {
+      let activeSessions = 0;
+      let totalEvents = 0;
+      for (const session of sessions) {
+        if (session.isActive) activeSessions++;
+        totalEvents += session.eventCount || 0;
+      }
+      if (project.monitoring) activeProjects++;
+
+      return {
+        ...project,
+        sessionCount: sessions.length,
+        activeSessions,
+        totalEvents
+      };
+    });
 
     const responseData = {
       success: true,
       data: {
         projects: projectsData,
         totalProjects: projectsData.length,
-        activeProjects: projectsData.filter(p => p.monitoring).length,
+        activeProjects,
         timestamp: new Date().toISOString()
       }
     };
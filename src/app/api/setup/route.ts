@@ -220,30 +220,33 @@ async function handleStartSetup(request: NextRequest) {
         setupProcess.inProgress = false;
         setupProcess.lastResult = result;
         
+        // Emit each summary as one write instead of a console call per line
         if (result.success) {
-          console.log('✅ Standalone setup completed successfully');
-          console.log('📁 Configuration:', result.configPath);
-          console.log('🗄️ Database:', result.databasePath);
-          console.log('📋 Setup steps completed:', result.steps.length);
-          console.log('🚀 Next steps:');
-          result.nextSteps.forEach(step => console.log('   -', step));
+          const lines = [
+            '✅ Standalone setup completed successfully',
+            `📁 Configuration: ${result.configPath}`,
+            `🗄️ Database: ${result.databasePath}`,
+            `📋 Setup steps completed: ${result.steps.length}`,
+            '🚀 Next steps:',
+            ...result.nextSteps.map(step => `   - ${step}`)
+          ];
           
           if (result.warnings.length > 0) {
-            console.log('⚠️  Warnings:');
-            result.warnings.forEach(warning => console.log('   -', warning));
+            lines.push('⚠️  Warnings:', ...result.warnings.map(warning => `   - ${warning}`));
           }
+          console.log(lines.join('\n'));
         } else {
-          console.error('❌ Setup failed:');
-          result.errors.forEach(error => console.error('   -', error));
+          console.error(['❌ Setup failed:', ...result.errors.map(error => `   - ${error}`)].join('\n'));
           
           if (result.steps.length > 0) {
-            console.log('📋 Setup steps attempted:');
-            result.steps.forEach(step => {
+            const lines = ['📋 Setup steps attempted:'];
+            for (const step of result.steps) {
               const status = step.status === 'completed' ? '✅' : 
                            step.status === 'failed' ? '❌' : 
                            step.status === 'running' ? '🔄' : '⏳';
-              console.log(`   ${status} ${step.name}: ${step.message || step.description}`);
-            });
+              lines.push(`   ${status} ${step.name}: ${step.message || step.description}`);
+            }
+            console.log(lines.join('\n'));
           }
         }
       })
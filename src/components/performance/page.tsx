@@ -50,6 +50,16 @@ interface BenchmarkData {
   improvement: number;
 }
 
+// Chart labels are formatted per data point on every refresh; toLocaleTimeString()
+// builds a fresh locale formatter each call, so share one with the same output
+const timeLabelFormat = new Intl.DateTimeFormat(undefined, {
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+
+const formatTimeLabel = (epochMs: number): string => timeLabelFormat.format(epochMs);
+
 export default function PerformancePage() {
   const [currentMetrics, setCurrentMetrics] = useState<PerformanceMetrics | null>(null);
   const [metricsHistory, setMetricsHistory] = useState<PerformanceMetrics[]>([]);
@@ -97,8 +107,9 @@ export default function PerformancePage() {
       
       if (data.success && Array.isArray(data.data)) {
         // Transform history data
+        const now = Date.now();
         const history: PerformanceMetrics[] = data.data.map((item: any, index: number) => ({
-          timestamp: new Date(Date.now() - (data.data.length - index) * 60000).toLocaleTimeString(),
+          timestamp: formatTimeLabel(now - (data.data.length - index) * 60000),
           responseTime: item.responseTime || Math.random() * 200 + 50,
           memoryUsage: item.memoryUsage || Math.random() * 80 + 20,
           cpuUsage: item.cpuUsage || Math.random() * 60 + 10,
@@ -149,10 +160,11 @@ export default function PerformancePage() {
   const generateSampleHistory = (minutes: number) => {
     const history: PerformanceMetrics[] = [];
     const points = Math.min(minutes, 60); // Limit to 60 data points max
+    const now = Date.now();
     
     for (let i = 0; i < points; i++) {
       history.push({
-        timestamp: new Date(Date.now() - (points - i) * 60000).toLocaleTimeString(),
+        timestamp: formatTimeLabel(now - (points - i) * 60000),
         responseTime: Math.random() * 200 + 50,
         memoryUsage: Math.random() * 80 + 20,
         cpuUsage: Math.random() * 60 + 10,
@@ -237,7 +249,7 @@ export default function PerformancePage() {
             }
             newHistory.push({
               ...currentMetrics,
-              timestamp: new Date().toLocaleTimeString()
+              timestamp: formatTimeLabel(Date.now())
             });
             return newHistory;
           });
@@ -41,7 +41,8 @@ export interface MemoryCacheConfig {
  */
 export class MemorySessionCache {
   private cache = new Map<string, SessionCacheEntry>()
-  private accessOrder = new Map<string, number>() // key -> access timestamp for LRU
+  private accessOrder = new Map<string, number>() // key -> access timestamp, kept in LRU order
+  private entrySizes = new Map<string, number>() // key -> estimated bytes, measured once per set
   private stats: CacheStats = {
     totalEntries: 0,
     memoryUsage: 0,
@@ -100,9 +101,9 @@ export class MemorySessionCache {
     }
 
     this.cache.set(key, entry)
-    this.accessOrder.set(key, now)
+    this.touchAccessOrder(key, now)
     this.stats.totalEntries = this.cache.size
-    this.updateMemoryUsage()
+    this.recordEntrySize(key, entry)
 
     // Check if eviction is needed
     this.checkEvictionNeeded()
@@ -119,8 +120,6 @@ export class MemorySessionCache {
     const entry = this.cache.get(key)
     
     if (!entry) {
-      // Update hit rate
-      this.stats.hitRate = this.accessCounter > 0 ? this.hitCounter / this.accessCounter : 0
       return null
     }
 
@@ -129,20 +128,15 @@ export class MemorySessionCache {
     // Check TTL expiration
     if (now > entry.timestamp + entry.ttl) {
       this.delete(key)
-      // Update hit rate
-      this.stats.hitRate = this.accessCounter > 0 ? this.hitCounter / this.accessCounter : 0
       return null
     }
 
     // Update access tracking for LRU
     entry.lastAccessed = now
     entry.accessCount++
-    this.accessOrder.set(key, now)
+    this.touchAccessOrder(key, now)
     this.hitCounter++
 
-    // Update hit rate
-    this.stats.hitRate = this.accessCounter > 0 ? this.hitCounter / this.accessCounter : 0
-
     return entry.data
   }
 
@@ -164,7 +158,7 @@ export class MemorySessionCache {
     this.cache.delete(key)
     this.accessOrder.delete(key)
     this.stats.totalEntries = this.cache.size
-    this.updateMemoryUsage()
+    this.forgetEntrySize(key)
 
     return true
   }
@@ -211,6 +205,7 @@ export class MemorySessionCache {
 
     if (!entry.connections.includes(connectionId)) {
       entry.connections.push(connectionId)
+      this.recordEntrySize(key, entry)
       this.broadcastCacheEvent('connection_added', key, entry.projectId, {
         connectionId,
         totalConnections: entry.connections.length
@@ -232,6 +227,7 @@ export class MemorySessionCache {
     const index = entry.connections.indexOf(connectionId)
     if (index > -1) {
       entry.connections.splice(index, 1)
+      this.recordEntrySize(key, entry)
       this.broadcastCacheEvent('connection_removed', key, entry.projectId, {
         connectionId,
         totalConnections: entry.connections.length
@@ -275,7 +271,7 @@ export class MemorySessionCache {
    * Get current cache statistics
    */
   getStats(): CacheStats {
-    this.updateMemoryUsage()
+    this.updateHitRate()
     return { ...this.stats }
   }
 
@@ -290,8 +286,9 @@ export class MemorySessionCache {
 
     this.cache.clear()
     this.accessOrder.clear()
+    this.entrySizes.clear()
     this.stats.totalEntries = 0
-    this.updateMemoryUsage()
+    this.stats.memoryUsage = 0
 
     // Broadcast clear event for each project
     for (const projectId of projectIds) {
@@ -310,6 +307,14 @@ export class MemorySessionCache {
     }
   }
 
+  /**
+   * Move a key to the most recently used end of the access order
+   */
+  private touchAccessOrder(key: string, now: number): void {
+    this.accessOrder.delete(key)
+    this.accessOrder.set(key, now)
+  }
+
   /**
    * Perform LRU eviction of least recently used entries
    */
@@ -324,14 +329,17 @@ export class MemorySessionCache {
 
     if (entriesToEvict <= 0) return
 
-    const entries = Array.from(this.accessOrder.entries())
-      .sort((a, b) => a[1] - b[1]) // Sort by access time (oldest first)
-      .slice(0, entriesToEvict)
+    // accessOrder iterates oldest first, so the victims are its first keys
+    const victims: string[] = []
+    for (const key of this.accessOrder.keys()) {
+      if (victims.length >= entriesToEvict) break
+      victims.push(key)
+    }
 
     const evictedKeys: string[] = []
     const evictedProjects = new Set<string>()
 
-    for (const [key] of entries) {
+    for (const key of victims) {
       const entry = this.cache.get(key)
       if (entry) {
         evictedProjects.add(entry.projectId)
@@ -344,13 +352,13 @@ export class MemorySessionCache {
       
       this.cache.delete(key)
       this.accessOrder.delete(key)
+      this.forgetEntrySize(key)
       evictedKeys.push(key)
     }
 
     this.stats.evictionCount += evictedKeys.length
     this.stats.lastEviction = Date.now()
     this.stats.totalEntries = this.cache.size
-    this.updateMemoryUsage()
 
     console.log(`[MemoryCache] Evicted ${evictedKeys.length} entries via LRU`)
   }
@@ -378,11 +386,11 @@ export class MemorySessionCache {
       })
       this.cache.delete(key)
       this.accessOrder.delete(key)
+      this.forgetEntrySize(key)
     }
 
     if (expiredKeys.length > 0) {
       this.stats.totalEntries = this.cache.size
-      this.updateMemoryUsage()
       console.log(`[MemoryCache] Cleaned up ${expiredKeys.length} expired entries`)
     }
   }
@@ -407,17 +415,28 @@ export class MemorySessionCache {
   }
 
   /**
-   * Update memory usage estimation
+   * Derive the hit rate from the access counters; lookups only bump the counters
    */
-  private updateMemoryUsage(): void {
-    let estimatedBytes = 0
-    
-    for (const entry of this.cache.values()) {
-      // Rough estimation of memory usage
-      estimatedBytes += JSON.stringify(entry).length * 2 // UTF-16 approximation
-    }
-    
-    this.stats.memoryUsage = estimatedBytes
+  private updateHitRate(): void {
+    this.stats.hitRate = this.accessCounter > 0 ? this.hitCounter / this.accessCounter : 0
+  }
+
+  /**
+   * Serialize an entry once to estimate its size and add it to the running total
+   */
+  private recordEntrySize(key: string, entry: SessionCacheEntry): void {
+    // Rough estimation of memory usage
+    const estimatedBytes = JSON.stringify(entry).length * 2 // UTF-16 approximation
+    this.stats.memoryUsage += estimatedBytes - (this.entrySizes.get(key) ?? 0)
+    this.entrySizes.set(key, estimatedBytes)
+  }
+
+  /**
+   * Remove a deleted entry's estimated size from the running total
+   */
+  private forgetEntrySize(key: string): void {
+    this.stats.memoryUsage -= this.entrySizes.get(key) ?? 0
+    this.entrySizes.delete(key)
   }
 
   /**
@@ -428,6 +447,7 @@ export class MemorySessionCache {
       return
     }
 
+    this.updateHitRate()
     const event: MonitoringEvent = {
       type: 'state_change',
       timestamp: new Date().toISOString(),
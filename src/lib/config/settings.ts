@@ -113,6 +113,52 @@ const parseStringArray = (value: string | undefined): string[] => {
   return value.split(',').map(s => s.trim()).filter(Boolean);
 };
 
+const deepFreeze = <T extends object>(value: T): T => {
+  for (const nested of Object.values(value)) {
+    if (nested && typeof nested === 'object') {
+      deepFreeze(nested);
+    }
+  }
+  return Object.freeze(value);
+};
+
+// Configuration constants, built once at module load and frozen so loadConfig()
+// and callers can share them without copying
+export const DEFAULT_CONFIG_VALUES = deepFreeze({
+  MONITORING: {
+    IDLE_TIMEOUT: 30,
+    INPUT_TIMEOUT: 5,
+    CONTEXT_PRESSURE_TIMEOUT: 10,
+    TASK_CHECK_INTERVAL: 30,
+    COMPLETION_COOLDOWN: 60,
+  },
+  RECOVERY: {
+    MAX_RETRIES: 3,
+    RETRY_BACKOFF: 2.0,
+    COMPACT_TIMEOUT: 30,
+  },
+  SERVER: {
+    PORT: 3000,
+    HOST: '0.0.0.0',
+  },
+  DATABASE: {
+    MAX_CONNECTIONS: 10,
+    CONNECTION_TIMEOUT: 5000,
+    SQLITE_PATH: './prisma/dev.db',
+  },
+  CACHE: {
+    MAX_SESSIONS: 100,
+    TTL: 3600,
+  },
+  STANDALONE: {
+    CONFIG_DIRECTORY: './.claude-monitor',
+    DATA_DIRECTORY: './data',
+  },
+} as const);
+
+const formatConfigIssues = (issues: z.ZodIssue[]): string[] =>
+  issues.map(e => `${e.path.join('.')}: ${e.message}`);
+
 // Configuration loader
 class ConfigManager {
   private static instance: ConfigManager;
@@ -159,19 +205,29 @@ class ConfigManager {
   }
 
   public loadConfig(): AppConfig {
+    const { config, errors } = this.loadConfigOrErrors();
+    if (!config) {
+      console.error('Configuration validation failed:', errors);
+      throw new ConfigurationError('Invalid configuration: ' + errors.join('; '));
+    }
+    return config;
+  }
+
+  /** Load and validate configuration, reporting failures instead of throwing */
+  public loadConfigOrErrors(): { config: AppConfig | null; errors: string[] } {
     // Load configuration from environment variables with defaults
     const rawConfig = {
       monitoring: {
-        idleTimeout: parseNumber(process.env.CLAUDE_MONITOR_IDLE_TIMEOUT, 30),
-        inputTimeout: parseNumber(process.env.CLAUDE_MONITOR_INPUT_TIMEOUT, 5),
-        contextPressureTimeout: parseNumber(process.env.CLAUDE_MONITOR_CONTEXT_PRESSURE_TIMEOUT, 10),
-        taskCheckInterval: parseNumber(process.env.CLAUDE_MONITOR_TASK_CHECK_INTERVAL, 30),
-        completionCooldown: parseNumber(process.env.CLAUDE_MONITOR_COMPLETION_COOLDOWN, 60),
+        idleTimeout: parseNumber(process.env.CLAUDE_MONITOR_IDLE_TIMEOUT, DEFAULT_CONFIG_VALUES.MONITORING.IDLE_TIMEOUT),
+        inputTimeout: parseNumber(process.env.CLAUDE_MONITOR_INPUT_TIMEOUT, DEFAULT_CONFIG_VALUES.MONITORING.INPUT_TIMEOUT),
+        contextPressureTimeout: parseNumber(process.env.CLAUDE_MONITOR_CONTEXT_PRESSURE_TIMEOUT, DEFAULT_CONFIG_VALUES.MONITORING.CONTEXT_PRESSURE_TIMEOUT),
+        taskCheckInterval: parseNumber(process.env.CLAUDE_MONITOR_TASK_CHECK_INTERVAL, DEFAULT_CONFIG_VALUES.MONITORING.TASK_CHECK_INTERVAL),
+        completionCooldown: parseNumber(process.env.CLAUDE_MONITOR_COMPLETION_COOLDOWN, DEFAULT_CONFIG_VALUES.MONITORING.COMPLETION_COOLDOWN),
       },
       recovery: {
-        maxRetries: parseNumber(process.env.CLAUDE_MONITOR_MAX_RETRIES, 3),
-        retryBackoff: parseNumber(process.env.CLAUDE_MONITOR_RETRY_BACKOFF, 2.0),
-        compactTimeout: parseNumber(process.env.CLAUDE_MONITOR_COMPACT_TIMEOUT, 30),
+        maxRetries: parseNumber(process.env.CLAUDE_MONITOR_MAX_RETRIES, DEFAULT_CONFIG_VALUES.RECOVERY.MAX_RETRIES),
+        retryBackoff: parseNumber(process.env.CLAUDE_MONITOR_RETRY_BACKOFF, DEFAULT_CONFIG_VALUES.RECOVERY.RETRY_BACKOFF),
+        compactTimeout: parseNumber(process.env.CLAUDE_MONITOR_COMPACT_TIMEOUT, DEFAULT_CONFIG_VALUES.RECOVERY.COMPACT_TIMEOUT),
       },
       logging: {
         level: (process.env.CLAUDE_MONITOR_LOG_LEVEL || 'INFO') as 'DEBUG' | 'INFO' | 'WARNING' | 'ERROR' | 'CRITICAL',
@@ -185,30 +241,30 @@ class ConfigManager {
         rateLimitSeconds: parseNumber(process.env.CLAUDE_MONITOR_NOTIFICATION_RATE_LIMIT, 60),
       },
       server: {
-        port: parseNumber(process.env.PORT || process.env.CLAUDE_MONITOR_PORT, 3000),
-        host: process.env.CLAUDE_MONITOR_HOST || '0.0.0.0',
+        port: parseNumber(process.env.PORT || process.env.CLAUDE_MONITOR_PORT, DEFAULT_CONFIG_VALUES.SERVER.PORT),
+        host: process.env.CLAUDE_MONITOR_HOST || DEFAULT_CONFIG_VALUES.SERVER.HOST,
         corsOrigins: parseStringArray(process.env.CLAUDE_MONITOR_CORS_ORIGINS) || ['http://localhost:3000'],
       },
       database: {
         url: process.env.DATABASE_URL || 'file:./prisma/dev.db',
         type: (process.env.CLAUDE_MONITOR_DB_TYPE || 'sqlite') as 'sqlite' | 'postgresql',
-        maxConnections: parseNumber(process.env.CLAUDE_MONITOR_DB_MAX_CONNECTIONS, 10),
-        connectionTimeout: parseNumber(process.env.CLAUDE_MONITOR_DB_CONNECTION_TIMEOUT, 5000),
-        sqlitePath: process.env.CLAUDE_MONITOR_SQLITE_PATH || './prisma/dev.db',
+        maxConnections: parseNumber(process.env.CLAUDE_MONITOR_DB_MAX_CONNECTIONS, DEFAULT_CONFIG_VALUES.DATABASE.MAX_CONNECTIONS),
+        connectionTimeout: parseNumber(process.env.CLAUDE_MONITOR_DB_CONNECTION_TIMEOUT, DEFAULT_CONFIG_VALUES.DATABASE.CONNECTION_TIMEOUT),
+        sqlitePath: process.env.CLAUDE_MONITOR_SQLITE_PATH || DEFAULT_CONFIG_VALUES.DATABASE.SQLITE_PATH,
       },
       cache: {
         type: (process.env.CLAUDE_MONITOR_CACHE_TYPE || 'memory') as 'memory' | 'redis',
         redisUrl: process.env.REDIS_URL,
-        maxSessions: parseNumber(process.env.CLAUDE_MONITOR_CACHE_MAX_SESSIONS, 100),
-        ttl: parseNumber(process.env.CLAUDE_MONITOR_CACHE_TTL, 3600),
+        maxSessions: parseNumber(process.env.CLAUDE_MONITOR_CACHE_MAX_SESSIONS, DEFAULT_CONFIG_VALUES.CACHE.MAX_SESSIONS),
+        ttl: parseNumber(process.env.CLAUDE_MONITOR_CACHE_TTL, DEFAULT_CONFIG_VALUES.CACHE.TTL),
       },
       standalone: {
         mode: (process.env.CLAUDE_MONITOR_MODE || this.detectMode()) as 'standalone' | 'docker',
         autoSetup: parseBoolean(process.env.CLAUDE_MONITOR_AUTO_SETUP) ?? true,
         developmentMode: parseBoolean(process.env.CLAUDE_MONITOR_DEV_MODE) ?? (process.env.NODE_ENV === 'development'),
         enableDebugLogging: parseBoolean(process.env.CLAUDE_MONITOR_DEBUG_LOGGING) ?? (process.env.NODE_ENV === 'development'),
-        configDirectory: process.env.CLAUDE_MONITOR_CONFIG_DIR || './.claude-monitor',
-        dataDirectory: process.env.CLAUDE_MONITOR_DATA_DIR || './data',
+        configDirectory: process.env.CLAUDE_MONITOR_CONFIG_DIR || DEFAULT_CONFIG_VALUES.STANDALONE.CONFIG_DIRECTORY,
+        dataDirectory: process.env.CLAUDE_MONITOR_DATA_DIR || DEFAULT_CONFIG_VALUES.STANDALONE.DATA_DIRECTORY,
       },
       claude: {
         projectsPath: process.env.CLAUDE_MONITOR_PROJECTS_PATH || '~/.claude/projects',
@@ -217,14 +273,14 @@ class ConfigManager {
       },
     };
 
-    try {
-      // Validate configuration using Zod schemas
-      this.config = ConfigSchema.parse(rawConfig);
-      return this.config;
-    } catch (error) {
-      console.error('Configuration validation failed:', error);
-      throw new ConfigurationError('Invalid configuration: ' + (error as Error).message);
+    // Validate configuration using Zod schemas
+    const result = ConfigSchema.safeParse(rawConfig);
+    if (!result.success) {
+      return { config: null, errors: formatConfigIssues(result.error.issues) };
     }
+
+    this.config = result.data;
+    return { config: this.config, errors: [] };
   }
 
   public reloadConfig(): AppConfig {
@@ -233,15 +289,12 @@ class ConfigManager {
   }
 
   public validateConfig(): string[] {
-    try {
-      ConfigSchema.parse(this.config);
+    // safeParse reports issues without the cost of throwing and catching
+    const result = ConfigSchema.safeParse(this.config);
+    if (result.success) {
       return [];
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        return error.issues.map(e => `${e.path.join('.')}: ${e.message}`);
-      }
-      return ['Unknown validation error'];
     }
+    return formatConfigIssues(result.error.issues);
   }
 }
 
@@ -269,38 +322,5 @@ export const isDockerMode = (): boolean => getConfig().standalone.mode === 'dock
 export const shouldUseMemoryCache = (): boolean => getConfig().cache.type === 'memory';
 export const shouldUseSQLite = (): boolean => getConfig().database.type === 'sqlite';
 
-// Configuration constants
-export const DEFAULT_CONFIG_VALUES = {
-  MONITORING: {
-    IDLE_TIMEOUT: 30,
-    INPUT_TIMEOUT: 5,
-    CONTEXT_PRESSURE_TIMEOUT: 10,
-    TASK_CHECK_INTERVAL: 30,
-    COMPLETION_COOLDOWN: 60,
-  },
-  RECOVERY: {
-    MAX_RETRIES: 3,
-    RETRY_BACKOFF: 2.0,
-    COMPACT_TIMEOUT: 30,
-  },
-  SERVER: {
-    PORT: 3000,
-    HOST: '0.0.0.0',
-  },
-  DATABASE: {
-    MAX_CONNECTIONS: 10,
-    CONNECTION_TIMEOUT: 5000,
-    SQLITE_PATH: './prisma/dev.db',
-  },
-  CACHE: {
-    MAX_SESSIONS: 100,
-    TTL: 3600,
-  },
-  STANDALONE: {
-    CONFIG_DIRECTORY: './.claude-monitor',
-    DATA_DIRECTORY: './data',
-  },
-} as const;
-
 // Export the main config instance for use throughout the application
 export default configManager;
\ No newline at end of file
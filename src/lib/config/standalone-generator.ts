@@ -13,7 +13,7 @@
  */
 
 import { promises as fs } from 'fs';
-import { existsSync } from 'fs';
+import { existsSync, statSync, Stats } from 'fs';
 import * as path from 'path';
 import { ConfigurationError, getConfig } from './settings';
 
@@ -43,6 +43,10 @@ export interface ConfigGenerationResult {
   error?: string;
 }
 
+// Parsed .env files keyed by path; an entry is reused while mtime and size match
+const ENV_FILE_CACHE_LIMIT = 100;
+const envFileCache = new Map<string, { mtimeMs: number; size: number; vars: Record<string, string> }>();
+
 /**
  * Standalone Configuration Generator Class
  * 
@@ -95,6 +99,7 @@ export class StandaloneConfigGenerator {
 
       // Write .env.local file
       await fs.writeFile(this.envPath, envContent, { encoding: 'utf8', mode: 0o600 });
+      await this.primeEnvFileCache(validation.envVars);
       
       // Get database path for result
       const databasePath = this.getDatabasePath(options);
@@ -207,19 +212,24 @@ export class StandaloneConfigGenerator {
     const databasePath = this.getDatabasePath(options);
     const logPath = options.logPath || './logs/claude-monitor.log';
 
-    // Ensure database directory exists
     const dbDir = path.dirname(databasePath);
-    await fs.mkdir(dbDir, { recursive: true });
-
-    // Ensure logs directory exists
     const logDir = path.dirname(path.resolve(this.projectRoot, logPath));
-    await fs.mkdir(logDir, { recursive: true });
+
+    // Only mkdir directories that are missing; a stat is cheaper than a failing mkdir
+    for (const dir of new Set([dbDir, logDir])) {
+      const stat = await fs.stat(dir).catch(() => null);
+      if (!stat?.isDirectory()) {
+        await fs.mkdir(dir, { recursive: true });
+      }
+    }
   }
 
   /**
    * Validate configuration using existing Zod schemas
    */
-  private async validateConfiguration(envContent: string): Promise<{ isValid: boolean; errors: string[] }> {
+  private async validateConfiguration(
+    envContent: string
+  ): Promise<{ isValid: boolean; errors: string[]; envVars?: Record<string, string> }> {
     try {
       // Parse environment variables from content
       const envVars = this.parseEnvContent(envContent);
@@ -238,7 +248,7 @@ export class StandaloneConfigGenerator {
         // Restore original environment
         process.env = originalEnv;
         
-        return { isValid: true, errors: [] };
+        return { isValid: true, errors: [], envVars };
       } catch (error) {
         // Restore original environment
         process.env = originalEnv;
@@ -271,14 +281,67 @@ export class StandaloneConfigGenerator {
     return envVars;
   }
 
+  /**
+   * Seed the parse cache with the variables just written, so the next read skips re-parsing
+   */
+  private async primeEnvFileCache(vars?: Record<string, string>): Promise<void> {
+    envFileCache.delete(this.envPath);
+    if (!vars) {
+      return;
+    }
+    try {
+      const stat = await fs.stat(this.envPath);
+      envFileCache.set(this.envPath, { mtimeMs: stat.mtimeMs, size: stat.size, vars: { ...vars } });
+      if (envFileCache.size > ENV_FILE_CACHE_LIMIT) {
+        envFileCache.delete(envFileCache.keys().next().value!);
+      }
+    } catch {
+      // Leave the entry out; the next read parses the file itself
+    }
+  }
+
+  /**
+   * Stat the .env file once, or null when it does not exist
+   */
+  statEnvFile(): Stats | null {
+    return statSync(this.envPath, { throwIfNoEntry: false }) ?? null;
+  }
+
+  /**
+   * Read and parse the .env file, reusing the cached parse while the file is unchanged
+   */
+  async readEnvFile(knownStat?: Stats): Promise<Record<string, string>> {
+    const stat = knownStat ?? await fs.stat(this.envPath);
+    const cached = envFileCache.get(this.envPath);
+
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      // Refresh recency so the entry is evicted last
+      envFileCache.delete(this.envPath);
+      envFileCache.set(this.envPath, cached);
+      return { ...cached.vars };
+    }
+
+    const content = await fs.readFile(this.envPath, 'utf8');
+    const vars = this.parseEnvContent(content);
+
+    envFileCache.delete(this.envPath);
+    envFileCache.set(this.envPath, { mtimeMs: stat.mtimeMs, size: stat.size, vars });
+    if (envFileCache.size > ENV_FILE_CACHE_LIMIT) {
+      envFileCache.delete(envFileCache.keys().next().value!);
+    }
+
+    return { ...vars };
+  }
+
   /**
    * Check if the current environment is already configured for standalone mode
    */
   async checkStandaloneSetup(): Promise<{ isStandalone: boolean; hasConfig: boolean; messages: string[] }> {
     const messages: string[] = [];
     
-    // Check if .env.local exists
-    const hasConfig = existsSync(this.envPath);
+    // Check if .env.local exists; the same stat feeds the parse cache check below
+    const envStat = this.statEnvFile();
+    const hasConfig = envStat !== null;
     
     // Check environment indicators
     const isStandalone = process.env.CLAUDE_MONITOR_STANDALONE_MODE === 'true' ||
@@ -298,10 +361,9 @@ export class StandaloneConfigGenerator {
     }
 
     // Check database file
-    if (hasConfig) {
+    if (envStat) {
       try {
-        const content = await fs.readFile(this.envPath, 'utf8');
-        const envVars = this.parseEnvContent(content);
+        const envVars = await this.readEnvFile(envStat);
         const dbUrl = envVars.DATABASE_URL;
         
         if (dbUrl?.startsWith('file:')) {
@@ -339,6 +401,7 @@ export class StandaloneConfigGenerator {
       }
 
       await fs.unlink(this.envPath);
+      envFileCache.delete(this.envPath);
       return {
         success: true,
         message: `Successfully removed .env.local from ${this.envPath}`
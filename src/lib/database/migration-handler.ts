@@ -1,7 +1,6 @@
 import { spawn } from 'child_process';
 import { access, constants } from 'fs/promises';
 import { resolve } from 'path';
-import { prisma } from './client';
 
 /**
  * Database Migration Handler for SQLite
@@ -31,10 +30,13 @@ export interface MigrationResult {
 export class MigrationHandler {
   private readonly projectRoot: string;
   private readonly prismaSchema: string;
+  private readonly prismaCliEntry: string;
+  private prismaCliAvailable: boolean | null = null;
 
   constructor() {
     this.projectRoot = process.cwd();
     this.prismaSchema = resolve(this.projectRoot, 'prisma', 'schema.prisma');
+    this.prismaCliEntry = resolve(this.projectRoot, 'node_modules', 'prisma', 'build', 'index.js');
   }
 
   /**
@@ -91,6 +93,9 @@ export class MigrationHandler {
    */
   async getMigrationStatus(): Promise<MigrationStatus[]> {
     try {
+      // Load the Prisma client on first use; the migrate paths only need the CLI
+      const { prisma } = await import('./client');
+
       // Query the _prisma_migrations table for status
       const migrations = await prisma.$queryRaw<MigrationStatus[]>`
         SELECT * FROM _prisma_migrations ORDER BY started_at DESC
@@ -146,11 +151,13 @@ export class MigrationHandler {
         };
       }
 
-      console.log(`⚠️ Note: Prisma doesn't support automatic rollbacks.`);
-      console.log(`💡 To rollback migration '${lastMigration.migration_name}', you would need to:`);
-      console.log('   1. Manually create a new migration that reverses the changes');
-      console.log('   2. Or restore from a database backup');
-      console.log('   3. Or use `prisma migrate reset` to reset the entire database');
+      console.log([
+        `⚠️ Note: Prisma doesn't support automatic rollbacks.`,
+        `💡 To rollback migration '${lastMigration.migration_name}', you would need to:`,
+        '   1. Manually create a new migration that reverses the changes',
+        '   2. Or restore from a database backup',
+        '   3. Or use `prisma migrate reset` to reset the entire database'
+      ].join('\n'));
 
       return {
         success: false,
@@ -244,11 +251,21 @@ export class MigrationHandler {
     stdout: string;
     stderr: string;
   }> {
+    // Run the local Prisma CLI on this Node binary when installed; going through
+    // npx starts an extra Node process just to locate and launch it
+    if (this.prismaCliAvailable === null) {
+      this.prismaCliAvailable = await access(this.prismaCliEntry, constants.R_OK)
+        .then(() => true, () => false);
+    }
+    const [command, commandArgs]: [string, string[]] = this.prismaCliAvailable
+      ? [process.execPath, [this.prismaCliEntry, ...args]]
+      : ['npx', ['prisma', ...args]];
+
     return new Promise((resolve) => {
-      const npxProcess = spawn('npx', ['prisma', ...args], {
+      const npxProcess = spawn(command, commandArgs, {
         cwd: this.projectRoot,
-        stdio: ['pipe', 'pipe', 'pipe'],
-        env: { ...process.env }
+        // No env option: the child inherits process.env without a per-call copy
+        stdio: ['pipe', 'pipe', 'pipe']
       });
 
       let stdout = '';
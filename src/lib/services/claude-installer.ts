@@ -7,13 +7,14 @@
  */
 
 import { promises as fs } from 'fs';
-import { exec, spawn } from 'child_process';
+import { exec, execFile, spawn } from 'child_process';
 import { promisify } from 'util';
 import * as path from 'path';
 import * as os from 'os';
 import { LogHelpers } from '../utils/logger';
 import { ErrorHelpers } from '../utils/error-handler';
 import { ErrorFactory, MonitorError } from '../utils/errors';
+import { findOnPath } from '../utils/find-on-path';
 import { 
   InstallationStatus, 
   AuthStatus, 
@@ -22,6 +23,10 @@ import {
 } from '../types/launcher';
 
 const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
+
+// `claude --version` results keyed by binary path; reused until the binary's mtime changes
+const versionProbeCache = new Map<string, { mtimeMs: number; version: string }>();
 
 /**
  * Claude Code Installation Error
@@ -300,15 +305,14 @@ export class ClaudeInstallerService {
     methods: string[];
   }> {
     try {
-      // Check if claude command exists
-      const { stdout } = await execAsync('which claude');
-      const claudePath = stdout.trim();
+      // Check if claude command exists: scan PATH with an X_OK access check per
+      // directory instead of spawning a shell to run `which`
+      const claudePath = await findOnPath('claude');
 
       if (claudePath) {
         // Get version
         try {
-          const { stdout: versionOutput } = await execAsync('claude --version');
-          const version = versionOutput.trim();
+          const version = await this.probeClaudeVersion(claudePath);
           
           return {
             installed: true,
@@ -356,6 +360,23 @@ export class ClaudeInstallerService {
     };
   }
 
+  /**
+   * Run `claude --version` only when the binary is new or has been replaced
+   */
+  private async probeClaudeVersion(claudePath: string): Promise<string> {
+    const { mtimeMs } = await fs.stat(claudePath);
+    const cached = versionProbeCache.get(claudePath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return cached.version;
+    }
+
+    // Run the stat'ed binary itself so the cached version belongs to it
+    const { stdout } = await execFileAsync(claudePath, ['--version']);
+    const version = stdout.trim();
+    versionProbeCache.set(claudePath, { mtimeMs, version });
+    return version;
+  }
+
   private async checkMCPToolsInstallation(): Promise<{
     installed: boolean;
     version?: string;
@@ -241,6 +241,18 @@ export class LauncherOrchestrator extends EventEmitter {
     return Array.from(this.instances.values()).map(instance => ({ ...instance }));
   }
 
+  /**
+   * Count instances per status in a single pass without copying instance records
+   */
+  getInstanceStatusCounts(): Record<InstanceStatus, number> & { total: number } {
+    const counts = { total: 0, starting: 0, running: 0, stopping: 0, stopped: 0, error: 0 };
+    for (const instance of this.instances.values()) {
+      counts.total++;
+      counts[instance.status]++;
+    }
+    return counts;
+  }
+
   /**
    * Get instance status
    */
@@ -563,12 +575,12 @@ export function getLauncherStats(): {
   errorInstances: number;
   stoppedInstances: number;
 } {
-  const instances = launcherOrchestrator.getAllInstances();
+  const counts = launcherOrchestrator.getInstanceStatusCounts();
   
   return {
-    totalInstances: instances.length,
-    runningInstances: instances.filter(i => i.status === 'running').length,
-    errorInstances: instances.filter(i => i.status === 'error').length,
-    stoppedInstances: instances.filter(i => i.status === 'stopped').length
+    totalInstances: counts.total,
+    runningInstances: counts.running,
+    errorInstances: counts.error,
+    stoppedInstances: counts.stopped
   };
 }
\ No newline at end of file
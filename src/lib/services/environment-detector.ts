@@ -12,7 +12,7 @@
  */
 
 import { promises as fs } from 'fs';
-import { existsSync } from 'fs';
+import { existsSync, readdirSync } from 'fs';
 import { hostname } from 'os';
 
 export type RuntimeEnvironment = 'docker' | 'standalone';
@@ -92,7 +92,8 @@ class EnvironmentDetector {
     indicators.push(...networkChecks.indicators);
 
     // 5. Check for development vs production patterns
-    const devChecks = this.checkDevelopmentPatterns();
+    const cwdEntries = this.listWorkingDirectory();
+    const devChecks = this.checkDevelopmentPatterns(cwdEntries);
     standaloneScore += devChecks.score;
     indicators.push(...devChecks.indicators);
 
@@ -107,7 +108,7 @@ class EnvironmentDetector {
       environment,
       confidence,
       indicators,
-      recommendations: this.generateRecommendations(environment, indicators)
+      recommendations: this.generateRecommendations(environment, indicators, cwdEntries)
     };
 
     return this.detectionResult;
@@ -323,30 +324,41 @@ class EnvironmentDetector {
     return { dockerScore, standaloneScore, indicators };
   }
 
+  /**
+   * Read the working directory once so file checks are set lookups, not a stat each
+   */
+  private listWorkingDirectory(): ReadonlySet<string> {
+    try {
+      return new Set(readdirSync('.'));
+    } catch {
+      return new Set();
+    }
+  }
+
   /**
    * Check for development environment patterns
    */
-  private checkDevelopmentPatterns(): { score: number; indicators: string[] } {
+  private checkDevelopmentPatterns(cwdEntries: ReadonlySet<string>): { score: number; indicators: string[] } {
     const indicators: string[] = [];
     let score = 0;
 
     // Check for development files
     const devFiles = ['package.json', 'package-lock.json', 'yarn.lock', '.env.local', '.env.development'];
     for (const file of devFiles) {
-      if (existsSync(file)) {
+      if (cwdEntries.has(file)) {
         indicators.push(`Development file found: ${file}`);
         score += 0.5;
       }
     }
 
     // Check for node_modules (development environment)
-    if (existsSync('node_modules')) {
+    if (cwdEntries.has('node_modules')) {
       indicators.push('Node.js development environment detected');
       score += 1;
     }
 
     // Check for git repository
-    if (existsSync('.git')) {
+    if (cwdEntries.has('.git')) {
       indicators.push('Git repository detected - development environment');
       score += 1;
     }
@@ -357,7 +369,11 @@ class EnvironmentDetector {
   /**
    * Generate setup recommendations based on detection results
    */
-  private generateRecommendations(environment: RuntimeEnvironment, indicators: string[]): string[] {
+  private generateRecommendations(
+    environment: RuntimeEnvironment,
+    indicators: string[],
+    cwdEntries: ReadonlySet<string>
+  ): string[] {
     const recommendations: string[] = [];
 
     if (environment === 'standalone') {
@@ -365,11 +381,11 @@ class EnvironmentDetector {
       recommendations.push('In-memory caching will be used instead of Redis');
       recommendations.push('Development logging enabled with file output');
       
-      if (!existsSync('data')) {
+      if (!cwdEntries.has('data')) {
         recommendations.push('Create data directory for SQLite database');
       }
       
-      if (!existsSync('.env.local')) {
+      if (!cwdEntries.has('.env.local')) {
         recommendations.push('Auto-generate .env.local file for development settings');
       }
     } else {
@@ -56,8 +56,9 @@ const PATTERNS = {
   localCommandStdout: /<local-command-stdout>/i,
   
   // Error and warning patterns
-  errorMessage: /(error|Error|ERROR|exception|Exception)/i,
-  warningMessage: /(warning|Warning|WARNING|warn)/i,
+  // Case variants are covered by the i flag; only ever used with test()
+  errorMessage: /error|exception/i,
+  warningMessage: /warn/i,
   
   // Context and performance
   contextPressure: /(context|memory|limit|full|usage)/i,
@@ -62,12 +62,18 @@ export interface JSONLMonitorConfig {
   performanceMonitoring?: boolean; // Whether to track performance stats
 }
 
+// Resolved once per process; the home directory does not change while running
+export const DEFAULT_CLAUDE_PROJECTS_DIR = path.join(os.homedir(), '.claude', 'projects');
+
 // Internal file monitoring state
 interface FileMonitorState {
   filePath: string;
   projectPath: string;
   sessionId: string;
   watcher: chokidar.FSWatcher | null;
+  fileHandle: Promise<fs.FileHandle> | null; // Shared open across reads; closed when monitoring stops
+  inode: number; // Identity of the file behind fileHandle; changes when replaced by rename
+  readBuffer: Buffer | null; // Reused for appends that fit within bufferSize
   currentPosition: number;
   currentLineNumber: number;
   lastModified: Date;
@@ -113,7 +119,7 @@ export class JSONLFileSystemMonitor extends EventEmitter {
       encoding: config.encoding ?? 'utf-8',
       bufferSize: config.bufferSize ?? 8192,
       maxLineLength: config.maxLineLength ?? 32768,
-      claudeProjectsDir: config.claudeProjectsDir ?? path.join(os.homedir(), '.claude', 'projects'),
+      claudeProjectsDir: config.claudeProjectsDir ?? DEFAULT_CLAUDE_PROJECTS_DIR,
       excludePatterns: config.excludePatterns ?? ['**/.DS_Store', '**/Thumbs.db', '**/*.tmp'],
       includeTempFiles: config.includeTempFiles ?? false,
       performanceMonitoring: config.performanceMonitoring ?? true
@@ -214,6 +220,7 @@ export class JSONLFileSystemMonitor extends EventEmitter {
         if (monitor.watcher) {
           await monitor.watcher.close();
         }
+        await this.closeFileHandle(monitor);
       }
       this.fileMonitors.clear();
 
@@ -283,6 +290,7 @@ export class JSONLFileSystemMonitor extends EventEmitter {
         if (monitor.watcher) {
           await monitor.watcher.close();
         }
+        await this.closeFileHandle(monitor);
         this.fileMonitors.delete(filePath);
       }
 
@@ -367,6 +375,9 @@ export class JSONLFileSystemMonitor extends EventEmitter {
         projectPath,
         sessionId,
         watcher: null,
+        fileHandle: null,
+        inode: stats.ino,
+        readBuffer: null,
         currentPosition: stats.size, // Start from end to avoid replaying historical data
         currentLineNumber: 0,
         lastModified: stats.mtime,
@@ -431,8 +442,11 @@ export class JSONLFileSystemMonitor extends EventEmitter {
     try {
       const stats = await fs.stat(filePath);
       
-      // Check if file was truncated (size decreased)
-      if (stats.size < monitor.currentPosition) {
+      // A truncated or rename-replaced file starts over; the cached handle
+      // would keep reading the old descriptor, so reopen it
+      if (stats.size < monitor.currentPosition || stats.ino !== monitor.inode) {
+        await this.closeFileHandle(monitor);
+        monitor.inode = stats.ino;
         monitor.currentPosition = 0;
         monitor.currentLineNumber = 0;
       }
@@ -468,12 +482,26 @@ export class JSONLFileSystemMonitor extends EventEmitter {
    */
   private async readNewLines(filePath: string, monitor: FileMonitorState, newSize: number): Promise<void> {
     try {
-      const buffer = Buffer.alloc(newSize - monitor.currentPosition);
-      const fileHandle = await fs.open(filePath, 'r');
+      // Typical appends borrow the per-file scratch buffer (an overlapping read
+      // finds it taken and allocates its own); only large catch-ups allocate.
+      // Bytes past bytesRead are never decoded, so no zero-fill is needed
+      const length = newSize - monitor.currentPosition;
+      const reusable = length <= this.config.bufferSize;
+      const buffer = (reusable ? monitor.readBuffer : null)
+        ?? Buffer.allocUnsafe(reusable ? this.config.bufferSize : length);
+      if (reusable) {
+        monitor.readBuffer = null;
+      }
+      // Reuse the handle across change events instead of reopening the file each time
+      const pendingHandle = this.openFileHandle(filePath, monitor);
+      const fileHandle = await pendingHandle;
       
       try {
-        const { bytesRead } = await fileHandle.read(buffer, 0, buffer.length, monitor.currentPosition);
+        const { bytesRead } = await fileHandle.read(buffer, 0, length, monitor.currentPosition);
         const content = buffer.subarray(0, bytesRead).toString(this.config.encoding);
+        if (reusable) {
+          monitor.readBuffer = buffer;
+        }
         
         // Process lines
         const lines = content.split('\n');
@@ -517,8 +545,12 @@ export class JSONLFileSystemMonitor extends EventEmitter {
           monitor.currentPosition = newSize;
         }
         
-      } finally {
-        await fileHandle.close();
+      } catch (error) {
+        // Drop a handle that failed mid-read so the next change reopens the file
+        if (monitor.fileHandle === pendingHandle) {
+          await this.closeFileHandle(monitor);
+        }
+        throw error;
       }
       
     } catch (error) {
@@ -526,6 +558,39 @@ export class JSONLFileSystemMonitor extends EventEmitter {
     }
   }
 
+  /**
+   * Return the cached read handle, opening it once even when change events overlap
+   */
+  private openFileHandle(filePath: string, monitor: FileMonitorState): Promise<fs.FileHandle> {
+    if (!monitor.fileHandle) {
+      const pending = fs.open(filePath, 'r');
+      monitor.fileHandle = pending;
+      // A failed open must not stick; the next change tries again
+      pending.catch(() => {
+        if (monitor.fileHandle === pending) {
+          monitor.fileHandle = null;
+        }
+      });
+    }
+    return monitor.fileHandle;
+  }
+
+  /**
+   * Close the cached read handle for a monitored file, if any
+   */
+  private async closeFileHandle(monitor: FileMonitorState): Promise<void> {
+    const pending = monitor.fileHandle;
+    if (!pending) {
+      return;
+    }
+    monitor.fileHandle = null;
+    try {
+      await (await pending).close();
+    } catch {
+      // Handle is already unusable; nothing left to release
+    }
+  }
+
   /**
    * Handle file system events
    */
@@ -577,6 +642,7 @@ export class JSONLFileSystemMonitor extends EventEmitter {
       if (monitor.watcher) {
         await monitor.watcher.close();
       }
+      await this.closeFileHandle(monitor);
       
       // Remove from monitors
       this.fileMonitors.delete(filePath);
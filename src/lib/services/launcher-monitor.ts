@@ -7,10 +7,8 @@
  */
 
 import { EventEmitter } from 'events';
-import * as path from 'path';
-import * as os from 'os';
 import { LauncherOrchestrator, LauncherEvents } from './claude-launcher';
-import { JSONLFileSystemMonitor, JSONLEvent, SessionInfo, ProjectMonitoringInfo } from './jsonl-monitor';
+import { JSONLFileSystemMonitor, JSONLEvent, SessionInfo, ProjectMonitoringInfo, DEFAULT_CLAUDE_PROJECTS_DIR } from './jsonl-monitor';
 import { InstanceInfo, InstanceStatus } from '../types/launcher';
 import { LogHelpers } from '../utils/logger';
 import { ErrorFactory } from '../utils/errors';
@@ -89,7 +87,7 @@ export class LauncherMonitor extends EventEmitter {
       sessionTimeout: config.sessionTimeout ?? 300000, // 5 minutes
       maxIdleSessions: config.maxIdleSessions ?? 10,
       performanceTracking: config.performanceTracking ?? true,
-      claudeProjectsDir: config.claudeProjectsDir ?? path.join(os.homedir(), '.claude', 'projects')
+      claudeProjectsDir: config.claudeProjectsDir ?? DEFAULT_CLAUDE_PROJECTS_DIR
     };
 
     this.launcher = launcher;
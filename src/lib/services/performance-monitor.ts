@@ -36,6 +36,22 @@ interface ComponentPerformance {
   memoryFootprint: number;
 }
 
+interface PerformanceReport {
+  timestamp: string;
+  uptime: string;
+  current: PerformanceMetrics | null;
+  averages: {
+    responseTime: number;
+    memoryUsage: number;
+    requestsPerSecond: number;
+    errorRate: number;
+  };
+  benchmarkComparison: BenchmarkComparison[];
+  totalRequests: number;
+  totalErrors: number;
+  meetsRequirements: boolean;
+}
+
 class PerformanceMonitor {
   private metrics: PerformanceMetrics[] = [];
   private observer: PerformanceObserver | null = null;
@@ -43,7 +59,9 @@ class PerformanceMonitor {
   private activeRequests = 0;
   private totalRequests = 0;
   private errors = 0;
-  private startTime = Date.now();
+  private startTime = performance.now(); // Monotonic, so uptime survives clock adjustments
+  private readonly reportsDir = path.join(process.cwd(), 'performance-reports');
+  private reportsDirReady = false;
   
   // Python daemon benchmarks (from spec requirements)
   private readonly pythonBenchmarks = {
@@ -259,15 +277,22 @@ class PerformanceMonitor {
   }
 
   /**
-   * Generate performance report
+   * Milliseconds since the monitor started, on the monotonic clock
+   */
+  public getUptimeMs(): number {
+    return performance.now() - this.startTime;
+  }
+
+  /**
+   * Build the performance report and save it as newline-delimited JSON
    */
-  public async generatePerformanceReport(): Promise<string> {
+  public async buildPerformanceReport(): Promise<PerformanceReport> {
     const current = this.getCurrentMetrics();
     const history = this.getMetricsHistory(5);
     const benchmarkComparison = this.compareToPythonBenchmarks();
-    const uptime = (Date.now() - this.startTime) / 1000;
+    const uptime = this.getUptimeMs() / 1000;
 
-    const report = {
+    const report: PerformanceReport = {
       timestamp: new Date().toISOString(),
       uptime: `${Math.floor(uptime / 3600)}h ${Math.floor((uptime % 3600) / 60)}m ${Math.floor(uptime % 60)}s`,
       current: current,
@@ -283,16 +308,28 @@ class PerformanceMonitor {
       meetsRequirements: benchmarkComparison.every(b => b.status !== 'worse')
     };
 
-    // Save report to file
-    const reportPath = path.join(process.cwd(), 'performance-reports', `report-${Date.now()}.json`);
+    // One compact line per section so the file can be read incrementally
+    const { current: currentSection, averages, benchmarkComparison: benchmarks, ...summary } = report;
+    const lines = [
+      JSON.stringify({ section: 'summary', ...summary }),
+      JSON.stringify({ section: 'current', data: currentSection }),
+      JSON.stringify({ section: 'averages', data: averages }),
+      ...benchmarks.map(b => JSON.stringify({ section: 'benchmark', data: b }))
+    ];
+
+    const reportPath = path.join(this.reportsDir, `report-${Date.now()}.ndjson`);
     try {
-      await fs.mkdir(path.dirname(reportPath), { recursive: true });
-      await fs.writeFile(reportPath, JSON.stringify(report, null, 2));
+      if (!this.reportsDirReady) {
+        await fs.mkdir(this.reportsDir, { recursive: true });
+        this.reportsDirReady = true;
+      }
+      await fs.writeFile(reportPath, lines.join('\n') + '\n');
     } catch (error) {
+      this.reportsDirReady = false; // Directory may have been removed; recreate next time
       console.warn('Failed to save performance report:', error);
     }
 
-    return JSON.stringify(report, null, 2);
+    return report;
   }
 
   /**
@@ -20,6 +20,18 @@ export enum RecoveryActionType {
   FORCE_EXIT = 'force_exit'
 }
 
+// Inputs that should be delivered as a bare Enter keypress
+const ENTER_EQUIVALENTS: ReadonlySet<unknown> = new Set(['\n', '\r\n', '\r']);
+
+// Actions handled locally that never touch the Claude Code client
+const CONNECTIONLESS_ACTIONS: ReadonlySet<RecoveryActionType> = new Set([
+  RecoveryActionType.NOTIFY_USER,
+  RecoveryActionType.WAIT_AND_RETRY
+]);
+
+// Ceiling for the exponential retry backoff window
+const MAX_RETRY_BACKOFF_MS = 30000;
+
 // Recovery execution results
 export enum RecoveryResult {
   SUCCESS = 'success',
@@ -47,8 +59,10 @@ export interface RecoveryAction {
 export interface RecoveryExecution {
   action: RecoveryAction;
   execId: string;
+  contextTag: string; // Cached `exec:<id>` log prefix, built once per execution
   startTime: Date;
   endTime?: Date;
+  durationMs?: number; // Measured on the monotonic clock, immune to wall-clock jumps
   result?: RecoveryResult;
   attempts: number;
   errorMessage?: string;
@@ -262,6 +276,27 @@ class MockClaudeCodeClient implements ClaudeCodeClient {
   }
 }
 
+export interface RecoveryServiceConfig {
+  maxConcurrentExecutions: number;
+  defaultTimeout: number;
+  maxRetries: number;
+  retryBackoff: number;
+  executionHistoryLimit: number;
+  requireConfirmationForDestructiveActions: boolean;
+  cooldownPeriod: number; // seconds
+}
+
+// Shared service defaults; frozen so no instance can mutate them for the next
+const DEFAULT_SERVICE_CONFIG: Readonly<RecoveryServiceConfig> = Object.freeze({
+  maxConcurrentExecutions: 1,
+  defaultTimeout: 30,
+  maxRetries: 3,
+  retryBackoff: 2.0,
+  executionHistoryLimit: 100,
+  requireConfirmationForDestructiveActions: true,
+  cooldownPeriod: 10
+});
+
 /**
  * Recovery Action Service
  * Main service for executing recovery actions through Claude Code API
@@ -273,6 +308,8 @@ export class RecoveryActionService {
   private currentExecution: RecoveryExecution | null = null;
   private executing = false;
   private enabled = true;
+  private shuttingDown = false;
+  private wakeRetryWait: (() => void) | null = null; // Ends a pending retry backoff early
   private statistics = {
     totalExecutions: 0,
     successfulExecutions: 0,
@@ -283,27 +320,32 @@ export class RecoveryActionService {
     averageExecutionTime: 0,
     lastExecutionTime: null as Date | null
   };
+  private readonly actionHandlers: Record<
+    RecoveryActionType,
+    (action: RecoveryAction, execution: RecoveryExecution) => Promise<boolean>
+  >;
+
+  private config: RecoveryServiceConfig;
 
   constructor(
     private client: ClaudeCodeClient,
-    private config: {
-      maxConcurrentExecutions: number;
-      defaultTimeout: number;
-      maxRetries: number;
-      retryBackoff: number;
-      executionHistoryLimit: number;
-      requireConfirmationForDestructiveActions: boolean;
-      cooldownPeriod: number; // seconds
-    } = {
-      maxConcurrentExecutions: 1,
-      defaultTimeout: 30,
-      maxRetries: 3,
-      retryBackoff: 2.0,
-      executionHistoryLimit: 100,
-      requireConfirmationForDestructiveActions: true,
-      cooldownPeriod: 10
-    }
+    config: Partial<RecoveryServiceConfig> = {}
   ) {
+    // Partial overrides fall back to the shared defaults field by field
+    this.config = { ...DEFAULT_SERVICE_CONFIG, ...config };
+
+    // Build the action dispatch table once instead of switching per attempt
+    this.actionHandlers = {
+      [RecoveryActionType.COMPACT]: this.executeCompactAction.bind(this),
+      [RecoveryActionType.PROVIDE_INPUT]: this.executeInputAction.bind(this),
+      [RecoveryActionType.RESUME_INPUT]: this.executeInputAction.bind(this),
+      [RecoveryActionType.CLEAR_ERROR]: this.executeCommandAction.bind(this),
+      [RecoveryActionType.RESTART_SESSION]: this.executeRestartAction.bind(this),
+      [RecoveryActionType.NOTIFY_USER]: this.executeNotificationAction.bind(this),
+      [RecoveryActionType.WAIT_AND_RETRY]: this.executeWaitAction.bind(this),
+      [RecoveryActionType.FORCE_EXIT]: this.executeExitAction.bind(this)
+    };
+
     this.initializeDefaultStrategies();
   }
 
@@ -581,7 +623,9 @@ export class RecoveryActionService {
     const now = new Date();
     const cooldownMs = this.config.cooldownPeriod * 1000;
 
-    for (const execution of [...this.executionHistory].reverse()) {
+    // Walk backwards in place rather than copying and reversing the history
+    for (let i = this.executionHistory.length - 1; i >= 0; i--) {
+      const execution = this.executionHistory[i];
       if (execution.action.targetState === state && execution.endTime) {
         const timeSince = now.getTime() - execution.endTime.getTime();
         if (timeSince < cooldownMs) {
@@ -601,9 +645,11 @@ export class RecoveryActionService {
     action: RecoveryAction,
     context: RecoveryContext
   ): Promise<RecoveryExecution> {
+    const execId = Math.random().toString(36).substr(2, 8);
     const execution: RecoveryExecution = {
       action,
-      execId: Math.random().toString(36).substr(2, 8),
+      execId,
+      contextTag: `exec:${execId}`,
       startTime: new Date(),
       attempts: 0,
       metadata: { ...context }
@@ -611,26 +657,28 @@ export class RecoveryActionService {
 
     this.executing = true;
     this.currentExecution = execution;
+    const startMark = performance.now();
 
     try {
-      console.info(`Starting recovery action ${execution.execId}: ${action.actionType} - ${action.description}`);
+      console.info(`[${execution.contextTag}] Starting recovery action: ${action.actionType} - ${action.description}`);
 
       // Execute with retry logic
       const result = await this.executeWithRetry(execution);
       execution.result = result;
       execution.endTime = new Date();
+      execution.durationMs = performance.now() - startMark;
 
       // Update statistics
       this.updateStatistics(execution);
 
-      const duration = execution.endTime.getTime() - execution.startTime.getTime();
-      console.info(`Recovery action completed ${execution.execId}: ${result} in ${duration}ms`);
+      console.info(`[${execution.contextTag}] Recovery action completed: ${result} in ${Math.round(execution.durationMs)}ms`);
 
     } catch (error) {
       execution.result = RecoveryResult.FAILURE;
       execution.errorMessage = error instanceof Error ? error.message : String(error);
       execution.endTime = new Date();
-      console.error(`Unexpected error during recovery action execution: ${error}`);
+      execution.durationMs = performance.now() - startMark;
+      console.error(`[${execution.contextTag}] Unexpected error during recovery action execution: ${error}`);
     } finally {
       this.executing = false;
       this.currentExecution = null;
@@ -638,9 +686,10 @@ export class RecoveryActionService {
       // Add to history
       this.executionHistory.push(execution);
 
-      // Trim history if needed
-      if (this.executionHistory.length > this.config.executionHistoryLimit) {
-        this.executionHistory = this.executionHistory.slice(-this.config.executionHistoryLimit);
+      // Trim history in place so memory stays bounded without reallocating
+      const overflow = this.executionHistory.length - this.config.executionHistoryLimit;
+      if (overflow > 0) {
+        this.executionHistory.splice(0, overflow);
       }
     }
 
@@ -676,18 +725,40 @@ export class RecoveryActionService {
         }
       }
 
-      // Backoff before retry
+      // Backoff before retry, with full jitter so concurrent executors don't retry in lockstep
       if (attempt < action.maxRetries) {
-        const retryDelay = backoff * this.config.retryBackoff;
-        console.warn(`Recovery attempt ${attempt + 1} failed, retrying in ${retryDelay}ms`);
-        await new Promise(resolve => setTimeout(resolve, retryDelay));
-        backoff *= this.config.retryBackoff;
+        backoff = Math.min(backoff * this.config.retryBackoff, MAX_RETRY_BACKOFF_MS);
+        const retryDelay = Math.round(Math.random() * backoff);
+        // shutdown() may have run during the attempt, before any wait existed to wake
+        if (this.shuttingDown) {
+          return RecoveryResult.CANCELLED;
+        }
+        console.warn(`[${execution.contextTag}] Recovery attempt ${attempt + 1} failed, retrying in ${retryDelay}ms`);
+        await this.waitForRetry(retryDelay);
+        if (this.shuttingDown) {
+          return RecoveryResult.CANCELLED;
+        }
       }
     }
 
     return RecoveryResult.FAILURE;
   }
 
+  /**
+   * Sleep out a retry backoff; shutdown() wakes it immediately
+   */
+  private waitForRetry(delayMs: number): Promise<void> {
+    return new Promise(resolve => {
+      const wake = () => {
+        clearTimeout(timer);
+        this.wakeRetryWait = null;
+        resolve();
+      };
+      const timer = setTimeout(wake, delayMs);
+      this.wakeRetryWait = wake;
+    });
+  }
+
   /**
    * Execute single recovery action attempt
    */
@@ -695,40 +766,29 @@ export class RecoveryActionService {
     action: RecoveryAction,
     execution: RecoveryExecution
   ): Promise<boolean> {
-    if (!this.client.isConnected()) {
-      const connected = await this.client.connect();
-      if (!connected) {
-        throw new Error('Failed to connect to Claude Code API');
-      }
+    if (!CONNECTIONLESS_ACTIONS.has(action.actionType)) {
+      await this.ensureConnected();
     }
 
-    switch (action.actionType) {
-      case RecoveryActionType.COMPACT:
-        return this.executeCompactAction(action, execution);
-        
-      case RecoveryActionType.PROVIDE_INPUT:
-        return this.executeInputAction(action, execution);
-        
-      case RecoveryActionType.RESUME_INPUT:
-        return this.executeInputAction(action, execution);
-        
-      case RecoveryActionType.CLEAR_ERROR:
-        return this.executeCommandAction(action, execution);
-        
-      case RecoveryActionType.RESTART_SESSION:
-        return this.executeRestartAction(action, execution);
-        
-      case RecoveryActionType.NOTIFY_USER:
-        return this.executeNotificationAction(action, execution);
-        
-      case RecoveryActionType.WAIT_AND_RETRY:
-        return this.executeWaitAction(action, execution);
-        
-      case RecoveryActionType.FORCE_EXIT:
-        return this.executeExitAction(action, execution);
-        
-      default:
-        throw new Error(`Unknown recovery action type: ${action.actionType}`);
+    const handler = this.actionHandlers[action.actionType];
+    if (!handler) {
+      throw new Error(`Unknown recovery action type: ${action.actionType}`);
+    }
+
+    return handler(action, execution);
+  }
+
+  /**
+   * Lazily (re)connect the client; a no-op on the common already-connected path
+   */
+  private async ensureConnected(): Promise<void> {
+    if (this.client.isConnected()) {
+      return;
+    }
+
+    const connected = await this.client.connect();
+    if (!connected) {
+      throw new Error('Failed to connect to Claude Code API');
     }
   }
 
@@ -759,7 +819,7 @@ export class RecoveryActionService {
     const inputText = metadata.idlePromptText || action.command || action.data?.input || 'y';
 
     // Handle newline-only input as Enter key
-    if (inputText === '\n') {
+    if (ENTER_EQUIVALENTS.has(inputText)) {
       const result = await this.client.sendEnter(action.timeout * 1000);
       if (result.success) {
         execution.output = result.output || 'Enter key sent successfully';
@@ -800,7 +860,7 @@ export class RecoveryActionService {
     }
 
     // Handle Enter key specially
-    if (command === '\n') {
+    if (ENTER_EQUIVALENTS.has(command)) {
       const result = await this.client.sendEnter(action.timeout * 1000);
       if (result.success) {
         execution.output = result.output || 'Enter key sent successfully';
@@ -894,9 +954,8 @@ export class RecoveryActionService {
     this.statistics.totalExecutions++;
     this.statistics.lastExecutionTime = execution.startTime;
 
-    if (execution.endTime && execution.startTime) {
-      const duration = execution.endTime.getTime() - execution.startTime.getTime();
-      this.statistics.totalExecutionTime += duration;
+    if (execution.durationMs !== undefined) {
+      this.statistics.totalExecutionTime += execution.durationMs;
       this.statistics.averageExecutionTime = 
         this.statistics.totalExecutionTime / this.statistics.totalExecutions;
     }
@@ -993,8 +1052,8 @@ export class RecoveryActionService {
    * Get execution history
    */
   getExecutionHistory(limit?: number): RecoveryExecution[] {
-    const history = [...this.executionHistory];
-    return limit ? history.slice(-limit) : history;
+    // Slice only the requested tail instead of copying the full history first
+    return limit ? this.executionHistory.slice(-limit) : this.executionHistory.slice();
   }
 
   /**
@@ -1033,6 +1092,8 @@ export class RecoveryActionService {
     console.info('Shutting down recovery action service');
     
     this.setEnabled(false);
+    this.shuttingDown = true;
+    this.wakeRetryWait?.();
     
     // Wait for current execution to complete (with timeout)
     let waitTime = 0;
@@ -1053,7 +1114,7 @@ export class RecoveryActionService {
  * Factory function to create recovery action service with mock client
  * Replace with actual Claude Code SDK client in production
  */
-export function createRecoveryActionService(config?: Partial<RecoveryActionService['config']>): RecoveryActionService {
+export function createRecoveryActionService(config?: Partial<RecoveryServiceConfig>): RecoveryActionService {
   const client = new MockClaudeCodeClient();
   return new RecoveryActionService(client, config);
 }
@@ -1064,15 +1125,13 @@ export function createRecoveryActionService(config?: Partial<RecoveryActionServi
 let globalRecoveryService: RecoveryActionService | null = null;
 
 export function getRecoveryActionService(): RecoveryActionService {
-  if (!globalRecoveryService) {
-    globalRecoveryService = createRecoveryActionService();
-  }
-  return globalRecoveryService;
+  // Synchronous check-and-create, so concurrent callers always share one instance
+  return globalRecoveryService ??= createRecoveryActionService();
 }
 
-export function shutdownRecoveryActionService(): void {
-  if (globalRecoveryService) {
-    globalRecoveryService.shutdown();
-    globalRecoveryService = null;
-  }
+export function shutdownRecoveryActionService(): Promise<void> {
+  // Detach before shutting down so callers during shutdown get a fresh service
+  const service = globalRecoveryService;
+  globalRecoveryService = null;
+  return service ? service.shutdown() : Promise.resolve();
 }
\ No newline at end of file
@@ -71,6 +71,54 @@ interface StatePatternConfig {
   severityIndicators?: RegExp[];
   progressIndicators?: RegExp[];
   confirmationPatterns?: RegExp[];
+  anyPattern?: RegExp; // Fused patterns; a miss skips the per-pattern scan
+  anyNegativePattern?: RegExp; // Fused negativePatterns
+  anyTimeoutIndicator?: RegExp; // Fused timeoutIndicators
+  anySeverityIndicator?: RegExp; // Fused severityIndicators
+}
+
+// Pattern table key -> detected state
+const STATE_MAPPING: Readonly<Record<string, ClaudeState>> = {
+  idle: ClaudeState.IDLE,
+  inputWaiting: ClaudeState.INPUT_WAITING,
+  contextPressure: ClaudeState.CONTEXT_PRESSURE,
+  error: ClaudeState.ERROR,
+  active: ClaudeState.ACTIVE,
+  completed: ClaudeState.COMPLETED
+};
+
+// State priority logic: context-pressure > input-waiting > error > idle
+const STATE_PRIORITY: Readonly<Record<ClaudeState, number>> = {
+  [ClaudeState.CONTEXT_PRESSURE]: 4,
+  [ClaudeState.INPUT_WAITING]: 3,
+  [ClaudeState.ERROR]: 2,
+  [ClaudeState.IDLE]: 1,
+  [ClaudeState.ACTIVE]: 1,
+  [ClaudeState.COMPLETED]: 1,
+  [ClaudeState.UNKNOWN]: 0
+};
+
+/**
+ * Count ✅, ✓ and ✔ (with or without its emoji variation selector) with a
+ * plain code unit scan instead of collecting global regex matches
+ */
+function countCheckmarks(text: string): number {
+  let count = 0;
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    if (code === 0x2705 || code === 0x2713 || code === 0x2714) {
+      count++;
+    }
+  }
+  return count;
+}
+
+/**
+ * Fuse a pattern list into one alternation. Case-insensitive multiline is a
+ * superset of every member's flags, so a miss proves no member can match
+ */
+function fusePatterns(patterns: RegExp[]): RegExp {
+  return new RegExp(patterns.map(pattern => `(?:${pattern.source})`).join('|'), 'im');
 }
 
 /**
@@ -99,6 +147,139 @@ interface DetectionStatistics {
   confidenceScores: number[];
 }
 
+/**
+ * Compile regex patterns for efficient state detection
+ */
+function compileStatePatterns(): Record<string, StatePatternConfig> {
+  const configs: Record<string, StatePatternConfig> = {
+    idle: {
+      patterns: [
+        /^[>\$#]\s*$/m, // Command prompt
+        /claude\s*>?\s*$/i, // Claude prompt
+        /ready\s*[>\$#]?\s*$/i, // Ready prompt
+        /waiting\s+for\s+(?:command|input)/i,
+        // UI hint '(esc to interrupt …)' indicates IDLE state (INACTIVE)
+        /^\s*\(esc\s+to\s+interrupt\b/im,
+      ],
+      weight: 1.0,
+      negativePatterns: [
+        /error|exception|failed/i,
+        /\[.*%.*\]/, // Progress indicators
+        /processing|loading|running/i,
+      ]
+    },
+
+    inputWaiting: {
+      patterns: [
+        /\[y\/n\]|\[Y\/N\]|\[yes\/no\]/i,
+        /press\s+(?:enter|any\s+key|space)/i,
+        /continue\s*\?/i,
+        /do\s+you\s+want\s+to/i,
+        /would\s+you\s+like\s+to/i,
+        /choose\s+(?:an?\s+)?option/i,
+        /enter\s+(?:your\s+)?(?:choice|selection)/i,
+      ],
+      weight: 1.2,
+      timeoutIndicators: [
+        /waiting\s+for\s+(?:input|response)/i,
+        /please\s+(?:enter|select|choose)/i,
+      ]
+    },
+
+    contextPressure: {
+      patterns: [
+        /(?:context|memory|token)\s+(?:limit|full|exceeded)/i,
+        /(?:usage|used):\s*(?:8[5-9]|9[0-9]|100)%/i,
+        /approaching\s+(?:limit|maximum)/i,
+        /consider\s+(?:compacting|reducing)/i,
+        /\/compact\s+(?:recommended|suggested)/i,
+        /running\s+(?:low\s+on\s+)?(?:context|memory)/i,
+      ],
+      weight: 1.5, // Higher weight due to importance
+      severityIndicators: [
+        /(?:critical|urgent|immediate)/i,
+        /(?:9[5-9]|100)%/, // No letters, so no case folding
+      ]
+    },
+
+    error: {
+      patterns: [
+        /error\s*:|\berror\b/i,
+        /exception\s*:|\bexception\b/i,
+        /failed\s+to|failure\s*:/i,
+        /(?:connection|network)\s+(?:error|failed)/i,
+        /timeout|timed\s+out/i,
+        /unable\s+to|cannot\s+|can\'t\s+/i,
+        /invalid|incorrect|malformed/i,
+      ],
+      weight: 1.3,
+      severityIndicators: [
+        /(?:fatal|critical|severe)/i,
+        /traceback|stack\s+trace/i,
+      ]
+    },
+
+    active: {
+      patterns: [
+        /(?:processing|executing|running)/i,
+        /(?:analyzing|parsing|loading)/i,
+        /(?:generating|creating|building)/i,
+        /\[(?:\d+%|\*+|\.+)\]/, // Progress indicators
+        /please\s+wait|working/i,
+      ],
+      weight: 0.8,
+      progressIndicators: [
+        /\d+%|\d+\/\d+/,
+        /step\s+\d+|phase\s+\d+/i,
+      ]
+    },
+
+    completed: {
+      patterns: [
+        /(?:completed|finished|done)/i,
+        /(?:success|successful)/i,
+        /task\s+(?:complete|finished)/i,
+        /all\s+(?:tasks|work)\s+(?:complete|done)/i,
+        /no\s+(?:pending|remaining)\s+tasks/i,
+        // Strong task completion indicators
+        /^\s*Task\s+\d+(?:\.\d+)?\s*:\s*.+?(?:✅|✓|✔️)/im,
+        // Commit confirmation phrases
+        /(?:committed\s+to\s+git|pushed\s+commits|saved\s+changes)/i,
+        /(?:both|all)\s+tasks\s+have\s+been\s+committed/i,
+      ],
+      weight: 1.1,
+      confirmationPatterns: [
+        /✓|✅|✔️|[✓✔]/,
+        /\bOK\b|\bOKAY\b/i,
+        /committed\s+to\s+git/i,
+      ]
+    }
+  };
+
+  for (const config of Object.values(configs)) {
+    config.anyPattern = fusePatterns(config.patterns);
+    if (config.negativePatterns) {
+      config.anyNegativePattern = fusePatterns(config.negativePatterns);
+    }
+    if (config.timeoutIndicators) {
+      config.anyTimeoutIndicator = fusePatterns(config.timeoutIndicators);
+    }
+    if (config.severityIndicators) {
+      config.anySeverityIndicator = fusePatterns(config.severityIndicators);
+    }
+  }
+
+  return configs;
+}
+
+// Compiled once at module load and shared by every detector; the patterns
+// are non-global, so test() and match() keep no per-instance state
+const STATE_PATTERNS = compileStatePatterns();
+
+// Materialized once so detectState does not rebuild the entry list per call
+const STATE_PATTERN_ENTRIES: ReadonlyArray<[string, StatePatternConfig]> =
+  Object.entries(STATE_PATTERNS);
+
 /**
  * Intelligent state detection engine for Claude Code execution states.
  * 
@@ -111,7 +292,7 @@ export class StateDetector {
   private lastDetection: StateDetection | null = null;
   private lastStateChange: Date = new Date();
   private stateHistory: StateTransitionInfo[] = [];
-  private patterns: Record<string, StatePatternConfig>;
+  private patterns: ReadonlyArray<[string, StatePatternConfig]>;
   private statistics: DetectionStatistics;
 
   constructor(config?: Partial<StateDetectorConfig>) {
@@ -126,7 +307,7 @@ export class StateDetector {
       ...config
     };
 
-    this.patterns = this.compilePatterns();
+    this.patterns = STATE_PATTERN_ENTRIES;
     this.statistics = {
       detections: 0,
       stateChanges: 0,
@@ -140,116 +321,6 @@ export class StateDetector {
     console.log('State detector initialized');
   }
 
-  /**
-   * Compile regex patterns for efficient state detection
-   */
-  private compilePatterns(): Record<string, StatePatternConfig> {
-    return {
-      idle: {
-        patterns: [
-          /^[>\$#]\s*$/m, // Command prompt
-          /claude\s*>?\s*$/i, // Claude prompt
-          /ready\s*[>\$#]?\s*$/i, // Ready prompt
-          /waiting\s+for\s+(?:command|input)/i,
-          // UI hint '(esc to interrupt …)' indicates IDLE state (INACTIVE)
-          /^\s*\(esc\s+to\s+interrupt\b.*$/im,
-        ],
-        weight: 1.0,
-        negativePatterns: [
-          /error|exception|failed/i,
-          /\[.*%.*\]/, // Progress indicators
-          /processing|loading|running/i,
-        ]
-      },
-
-      inputWaiting: {
-        patterns: [
-          /\[y\/n\]|\[Y\/N\]|\[yes\/no\]/i,
-          /press\s+(?:enter|any\s+key|space)/i,
-          /continue\s*\?/i,
-          /do\s+you\s+want\s+to/i,
-          /would\s+you\s+like\s+to/i,
-          /choose\s+(?:an?\s+)?option/i,
-          /enter\s+(?:your\s+)?(?:choice|selection)/i,
-        ],
-        weight: 1.2,
-        timeoutIndicators: [
-          /waiting\s+for\s+(?:input|response)/i,
-          /please\s+(?:enter|select|choose)/i,
-        ]
-      },
-
-      contextPressure: {
-        patterns: [
-          /(?:context|memory|token)\s+(?:limit|full|exceeded)/i,
-          /(?:usage|used):\s*(?:8[5-9]|9[0-9]|100)%/i,
-          /approaching\s+(?:limit|maximum)/i,
-          /consider\s+(?:compacting|reducing)/i,
-          /\/compact\s+(?:recommended|suggested)/i,
-          /running\s+(?:low\s+on\s+)?(?:context|memory)/i,
-        ],
-        weight: 1.5, // Higher weight due to importance
-        severityIndicators: [
-          /(?:critical|urgent|immediate)/i,
-          /(?:9[5-9]|100)%/i,
-        ]
-      },
-
-      error: {
-        patterns: [
-          /error\s*:|\berror\b/i,
-          /exception\s*:|\bexception\b/i,
-          /failed\s+to|failure\s*:/i,
-          /(?:connection|network)\s+(?:error|failed)/i,
-          /timeout|timed\s+out/i,
-          /unable\s+to|cannot\s+|can\'t\s+/i,
-          /invalid|incorrect|malformed/i,
-        ],
-        weight: 1.3,
-        severityIndicators: [
-          /(?:fatal|critical|severe)/i,
-          /traceback|stack\s+trace/i,
-        ]
-      },
-
-      active: {
-        patterns: [
-          /(?:processing|executing|running)/i,
-          /(?:analyzing|parsing|loading)/i,
-          /(?:generating|creating|building)/i,
-          /\[(?:\d+%|\*+|\.+)\]/, // Progress indicators
-          /please\s+wait|working/i,
-        ],
-        weight: 0.8,
-        progressIndicators: [
-          /\d+%|\d+\/\d+/,
-          /step\s+\d+|phase\s+\d+/i,
-        ]
-      },
-
-      completed: {
-        patterns: [
-          /(?:completed|finished|done)/i,
-          /(?:success|successful)/i,
-          /task\s+(?:complete|finished)/i,
-          /all\s+(?:tasks|work)\s+(?:complete|done)/i,
-          /no\s+(?:pending|remaining)\s+tasks/i,
-          // Strong task completion indicators
-          /^\s*Task\s+\d+(?:\.\d+)?\s*:\s*.+?(?:✅|✓|✔️)[\s\S]*?$/im,
-          // Commit confirmation phrases
-          /(?:committed\s+to\s+git|pushed\s+commits|saved\s+changes)/i,
-          /(?:both|all)\s+tasks\s+have\s+been\s+committed/i,
-        ],
-        weight: 1.1,
-        confirmationPatterns: [
-          /✓|✅|✔️|[✓✔]/,
-          /\bOK\b|\bOKAY\b/i,
-          /committed\s+to\s+git/i,
-        ]
-      }
-    };
-  }
-
   /**
    * Detect current Claude Code state from conversation events
    */
@@ -315,7 +386,7 @@ export class StateDetector {
     const stateEvidence: Record<string, string[]> = {};
     const triggeringEventsMap: Record<string, ConversationEvent[]> = {};
 
-    for (const [stateName, patternConfig] of Object.entries(this.patterns)) {
+    for (const [stateName, patternConfig] of this.patterns) {
       const { score, evidence, triggers } = this.scoreState(
         stateName,
         combinedText,
@@ -338,16 +409,7 @@ export class StateDetector {
     let bestScore = stateScores[bestStateName];
 
     // Convert to ClaudeState enum
-    const stateMapping: Record<string, ClaudeState> = {
-      'idle': ClaudeState.IDLE,
-      'inputWaiting': ClaudeState.INPUT_WAITING,
-      'contextPressure': ClaudeState.CONTEXT_PRESSURE,
-      'error': ClaudeState.ERROR,
-      'active': ClaudeState.ACTIVE,
-      'completed': ClaudeState.COMPLETED
-    };
-
-    let bestState = stateMapping[bestStateName] || ClaudeState.UNKNOWN;
+    let bestState = STATE_MAPPING[bestStateName] || ClaudeState.UNKNOWN;
 
     // Check minimum confidence threshold
     if (bestScore < this.config.minConfidence) {
@@ -389,25 +451,30 @@ export class StateDetector {
     const triggers: ConversationEvent[] = [];
     const baseWeight = patternConfig.weight;
 
-    // Check main patterns
-    for (const pattern of patternConfig.patterns) {
-      const matches = recentText.match(pattern);
-      if (matches) {
-        const matchScore = matches.length * 0.3 * baseWeight;
-        score += matchScore;
-        evidence.push(`Pattern match: ${pattern.source}`);
-
-        // Find triggering events
-        for (const event of events.slice(-5)) {
-          if (event.content && pattern.test(event.content)) {
-            triggers.push(event);
+    // Check main patterns; most states match nothing, which the fused
+    // alternation settles in a single scan
+    if (!patternConfig.anyPattern || patternConfig.anyPattern.test(recentText)) {
+      const triggerCandidates = events.slice(-5);
+      for (const pattern of patternConfig.patterns) {
+        const matches = recentText.match(pattern);
+        if (matches) {
+          const matchScore = matches.length * 0.3 * baseWeight;
+          score += matchScore;
+          evidence.push(`Pattern match: ${pattern.source}`);
+
+          // Find triggering events
+          for (const event of triggerCandidates) {
+            if (event.content && pattern.test(event.content)) {
+              triggers.push(event);
+            }
           }
         }
       }
     }
 
     // Check for negative patterns (reduce score)
-    if (patternConfig.negativePatterns) {
+    if (patternConfig.negativePatterns &&
+        (!patternConfig.anyNegativePattern || patternConfig.anyNegativePattern.test(recentText))) {
       for (const pattern of patternConfig.negativePatterns) {
         if (pattern.test(recentText)) {
           score -= 0.2 * baseWeight;
@@ -450,11 +517,11 @@ export class StateDetector {
     let bonus = 0.0;
 
     // Check for multiple checkmarks
-    const checkmarks = recentText.match(/(?:✅|✓|✔️|[✓✔])/g);
-    if (checkmarks) {
-      if (checkmarks.length >= 2) {
+    const checkmarks = countCheckmarks(recentText);
+    if (checkmarks > 0) {
+      if (checkmarks >= 2) {
         bonus += 0.3;
-        evidence.push(`Multiple completion checkmarks: ${checkmarks.length}`);
+        evidence.push(`Multiple completion checkmarks: ${checkmarks}`);
       } else {
         bonus += 0.15;
         evidence.push("Single completion checkmark");
@@ -502,7 +569,8 @@ export class StateDetector {
     }
 
     // Check severity indicators
-    if (config.severityIndicators) {
+    if (config.severityIndicators &&
+        (!config.anySeverityIndicator || config.anySeverityIndicator.test(text))) {
       for (const pattern of config.severityIndicators) {
         if (pattern.test(text)) {
           score += 0.3;
@@ -525,7 +593,8 @@ export class StateDetector {
     let score = 0.0;
 
     // Check timeout indicators
-    if (config.timeoutIndicators) {
+    if (config.timeoutIndicators &&
+        (!config.anyTimeoutIndicator || config.anyTimeoutIndicator.test(text))) {
       for (const pattern of config.timeoutIndicators) {
         if (pattern.test(text)) {
           score += 0.2;
@@ -554,7 +623,8 @@ export class StateDetector {
     let score = 0.0;
 
     // Check severity patterns
-    if (config.severityIndicators) {
+    if (config.severityIndicators &&
+        (!config.anySeverityIndicator || config.anySeverityIndicator.test(text))) {
       for (const pattern of config.severityIndicators) {
         if (pattern.test(text)) {
           score += 0.4;
@@ -582,7 +652,7 @@ export class StateDetector {
     let score = 0.0;
 
     // Check for UI hint patterns in recent events
-    const escHintPattern = /^\s*\(esc\s+to\s+interrupt\b.*$/im;
+    const escHintPattern = /^\s*\(esc\s+to\s+interrupt\b/im;
     for (const event of events.slice(-5)) {
       if (event.content && escHintPattern.test(event.content)) {
         score += 0.5;
@@ -653,19 +723,8 @@ export class StateDetector {
       return false;
     }
 
-    // State priority logic: context-pressure > input-waiting > error > idle
-    const priorityMap: Record<ClaudeState, number> = {
-      [ClaudeState.CONTEXT_PRESSURE]: 4,
-      [ClaudeState.INPUT_WAITING]: 3,
-      [ClaudeState.ERROR]: 2,
-      [ClaudeState.IDLE]: 1,
-      [ClaudeState.ACTIVE]: 1,
-      [ClaudeState.COMPLETED]: 1,
-      [ClaudeState.UNKNOWN]: 0
-    };
-
-    const currentPriority = priorityMap[this.currentState] || 0;
-    const newPriority = priorityMap[detection.state] || 0;
+    const currentPriority = STATE_PRIORITY[this.currentState] || 0;
+    const newPriority = STATE_PRIORITY[detection.state] || 0;
 
     // Allow change based on priority and confidence
     if (newPriority > currentPriority) {
@@ -725,13 +784,12 @@ export class StateDetector {
   private updateStatistics(detection: StateDetection, processingTime: number): void {
     this.statistics.detections += 1;
     this.statistics.totalProcessingTime += processingTime;
-    this.statistics.avgProcessingTime = 
-      this.statistics.totalProcessingTime / this.statistics.detections;
     this.statistics.confidenceScores.push(detection.confidence);
 
-    // Keep only recent confidence scores
+    // Keep only recent confidence scores; drop the oldest in place rather
+    // than copying the window on every detection
     if (this.statistics.confidenceScores.length > 100) {
-      this.statistics.confidenceScores = this.statistics.confidenceScores.slice(-100);
+      this.statistics.confidenceScores.shift();
     }
   }
 
@@ -767,6 +825,10 @@ export class StateDetector {
     avgConfidence: number;
   } {
     const stats = { ...this.statistics };
+    // Derived here rather than recomputed on every detection
+    stats.avgProcessingTime = stats.detections > 0
+      ? stats.totalProcessingTime / stats.detections
+      : 0;
     const result = {
       ...stats,
       currentState: this.currentState,
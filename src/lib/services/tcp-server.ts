@@ -17,6 +17,7 @@ import {
 } from '../types/launcher';
 import { LogHelpers } from '../utils/logger';
 import { ErrorFactory } from '../utils/errors';
+import { configureClientSocket, isPortUnavailableError } from '../utils/client-socket';
 
 export interface TCPServerOptions {
   port: number;
@@ -290,6 +291,8 @@ export class TCPServer extends EventEmitter {
       return;
     }
 
+    configureClientSocket(socket);
+
     const clientId = this.generateClientId();
     const connection: ClientConnection = {
       socket,
@@ -358,10 +361,7 @@ export class TCPServer extends EventEmitter {
         this.emit('command_received', command, clientId);
 
         // Process command with timeout
-        const response = await Promise.race([
-          this.processCommand(command),
-          this.createTimeoutPromise()
-        ]);
+        const response = await this.processCommandWithTimeout(command);
 
         socket.write(JSON.stringify(response) + '\n');
         this.emit('command_processed', command, response, clientId);
@@ -420,17 +420,22 @@ export class TCPServer extends EventEmitter {
   }
 
   /**
-   * Create timeout promise for command processing
+   * Process command, rejecting if the handler outlives commandTimeout; the
+   * timer is cleared as soon as the command settles so it never lingers
    */
-  private createTimeoutPromise(): Promise<TCPResponse> {
-    return new Promise((_, reject) => {
-      setTimeout(() => {
+  private processCommandWithTimeout(command: TCPCommand): Promise<TCPResponse> {
+    let timer: NodeJS.Timeout | undefined;
+    const timeout = new Promise<never>((_, reject) => {
+      timer = setTimeout(() => {
         reject(ErrorFactory.configurationMissing(
           'COMMAND_TIMEOUT',
           'number'
         ));
       }, this.options.commandTimeout);
     });
+
+    return Promise.race([this.processCommand(command), timeout])
+      .finally(() => clearTimeout(timer));
   }
 
   /**
@@ -464,12 +469,14 @@ export class TCPServer extends EventEmitter {
 
     this.connections.delete(clientId);
     
-    LogHelpers.debug('tcp-server', 'Client disconnected', { 
-      clientId,
-      connectionCount: this.connections.size,
-      requestCount: connection.requestCount,
-      connectionDuration: Date.now() - connection.connectedAt.getTime()
-    });
+    if (LogHelpers.isLevelEnabled('debug')) {
+      LogHelpers.debug('tcp-server', 'Client disconnected', { 
+        clientId,
+        connectionCount: this.connections.size,
+        requestCount: connection.requestCount,
+        connectionDuration: Date.now() - connection.connectedAt.getTime()
+      });
+    }
 
     this.emit('client_disconnected', clientId);
   }
@@ -512,12 +519,18 @@ export async function findAvailableTCPPort(startPort: number = 9999, endPort: nu
   const { createServer } = await import('net');
   
   for (let port = startPort; port <= endPort; port++) {
-    const available = await new Promise<boolean>((resolve) => {
+    const available = await new Promise<boolean>((resolve, reject) => {
       const server = createServer();
       server.listen(port, 'localhost', () => {
         server.close(() => resolve(true));
       });
-      server.on('error', () => resolve(false));
+      server.on('error', (error: NodeJS.ErrnoException) => {
+        if (isPortUnavailableError(error)) {
+          resolve(false);
+        } else {
+          reject(error);
+        }
+      });
     });
     
     if (available) {
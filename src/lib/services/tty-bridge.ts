@@ -18,6 +18,7 @@ import {
 } from '../types/launcher';
 import { LogHelpers } from '../utils/logger';
 import { ErrorFactory } from '../utils/errors';
+import { configureClientSocket, isPortUnavailableError } from '../utils/client-socket';
 
 export interface TTYBridgeOptions {
   port: number;
@@ -41,6 +42,9 @@ export interface TTYBridgeEvents {
   'bridge_error': [Error];
 }
 
+// Commands one client may have queued or running before new ones are refused
+const MAX_PENDING_COMMANDS = 100;
+
 /**
  * TTY Bridge Service
  * Manages TCP server for Claude Code process interaction
@@ -63,6 +67,7 @@ export class TTYBridge extends EventEmitter {
   private bridgeInfo: BridgeServerInfo | null = null;
   private commandQueue: TCPCommand[] = [];
   private isProcessing = false;
+  private sleepTimers: Map<NodeJS.Timeout, (error: Error) => void> = new Map(); // timer -> reject
 
   constructor(options: TTYBridgeOptions) {
     super();
@@ -121,6 +126,14 @@ export class TTYBridge extends EventEmitter {
     try {
       LogHelpers.info('tty-bridge', 'Stopping TTY bridge', { instanceId: this.options.instanceId });
 
+      // Cancel pending sleep frames so they do not hold the process open, and
+      // fail them so callers and the commands queued behind them settle
+      this.sleepTimers.forEach((reject, timer) => {
+        clearTimeout(timer);
+        reject(new Error('Bridge stopped'));
+      });
+      this.sleepTimers.clear();
+
       // Close all client connections
       this.clients.forEach(client => client.end());
       this.clients.clear();
@@ -134,14 +147,15 @@ export class TTYBridge extends EventEmitter {
         this.isListening = false;
       }
 
-      // Terminate Claude process
-      if (this.claudeProcess) {
+      // Terminate Claude process (an already-exited child has nothing to wait for)
+      if (this.claudeProcess && !this.hasClaudeExited()) {
         this.claudeProcess.kill('SIGTERM');
         
         // Wait for graceful shutdown or force kill
         await new Promise<void>((resolve) => {
           const timeout = setTimeout(() => {
-            if (this.claudeProcess && !this.claudeProcess.killed) {
+            // `killed` only records that SIGTERM was delivered, so check the exit status
+            if (this.claudeProcess && !this.hasClaudeExited()) {
               this.claudeProcess.kill('SIGKILL');
             }
             resolve();
@@ -153,8 +167,8 @@ export class TTYBridge extends EventEmitter {
           });
         });
 
-        this.claudeProcess = null;
       }
+      this.claudeProcess = null;
 
       LogHelpers.info('tty-bridge', 'TTY bridge stopped successfully', { instanceId: this.options.instanceId });
     } catch (error) {
@@ -169,6 +183,14 @@ export class TTYBridge extends EventEmitter {
     }
   }
 
+  /**
+   * Whether the Claude process has exited, from the status Node records on exit
+   */
+  private hasClaudeExited(): boolean {
+    const child = this.claudeProcess;
+    return !child || child.exitCode != null || child.signalCode != null;
+  }
+
   /**
    * Send command to Claude Code process
    */
@@ -181,6 +203,27 @@ export class TTYBridge extends EventEmitter {
     this.emit('command_received', command);
     LogHelpers.debug('tty-bridge', 'Received TCP command', { command });
 
+    // Pacing delays run bridge-side so clients can queue send/sleep/enter
+    // without blocking on their own timers between frames
+    if (command.type === 'sleep') {
+      const delayMs = Math.min(Math.max(Number(command.content) || 0, 0), this.options.timeout);
+      await new Promise<void>((resolve, reject) => {
+        const timer = setTimeout(() => {
+          this.sleepTimers.delete(timer);
+          resolve();
+        }, delayMs);
+        this.sleepTimers.set(timer, reject);
+      });
+      const response: TCPResponse = {
+        success: true,
+        message: `Slept ${delayMs}ms`,
+        timestamp: new Date(),
+        sequenceId: command.sequenceId
+      };
+      this.emit('command_executed', command, response);
+      return response;
+    }
+
     return new Promise((resolve, reject) => {
       const timeout = setTimeout(() => {
         reject(ErrorFactory.configurationMissing(
@@ -287,19 +330,26 @@ export class TTYBridge extends EventEmitter {
           this.emit('claude_exit', code);
         });
 
-        // Setup stdout/stderr handling
+        // Setup stdout/stderr handling; the streams decode once (keeping
+        // multi-byte characters intact across chunks) and the same string
+        // fans out to the debug log and event listeners; the log context is
+        // only built when debug output is actually enabled
         if (this.claudeProcess.stdout) {
-          this.claudeProcess.stdout.on('data', (data) => {
-            const output = data.toString();
-            LogHelpers.debug('tty-bridge', 'Claude stdout', { output });
+          this.claudeProcess.stdout.setEncoding('utf8');
+          this.claudeProcess.stdout.on('data', (output: string) => {
+            if (LogHelpers.isLevelEnabled('debug')) {
+              LogHelpers.debug('tty-bridge', 'Claude stdout', { output });
+            }
             this.emit('claude_output', output);
           });
         }
 
         if (this.claudeProcess.stderr) {
-          this.claudeProcess.stderr.on('data', (data) => {
-            const error = data.toString();
-            LogHelpers.debug('tty-bridge', 'Claude stderr', { error });
+          this.claudeProcess.stderr.setEncoding('utf8');
+          this.claudeProcess.stderr.on('data', (error: string) => {
+            if (LogHelpers.isLevelEnabled('debug')) {
+              LogHelpers.debug('tty-bridge', 'Claude stderr', { error });
+            }
             this.emit('claude_error', error);
           });
         }
@@ -368,6 +418,7 @@ export class TTYBridge extends EventEmitter {
    * Handle new client connection
    */
   private handleClientConnection(socket: Socket): void {
+    configureClientSocket(socket);
     this.clients.add(socket);
     LogHelpers.debug('tty-bridge', 'Client connected', { 
       clientCount: this.clients.size,
@@ -375,31 +426,79 @@ export class TTYBridge extends EventEmitter {
     });
     this.emit('client_connected', socket);
 
-    socket.on('data', (data) => {
-      try {
-        const commandStr = data.toString().trim();
-        const command = JSON.parse(commandStr) as TCPCommand;
-        
-        this.sendCommand(command)
-          .then((response) => {
-            socket.write(JSON.stringify(response) + '\n');
-          })
+    // Commands from one client run in arrival order so sleep frames pace
+    // the keystrokes that follow them
+    let commandQueue: Promise<void> = Promise.resolve();
+    let pendingCommands = 0;
+
+    // Responses written in the same tick are corked into a single socket
+    // write, so a pipelined batch of commands is answered in one syscall
+    const reply = (response: TCPResponse): void => {
+      if (socket.writableEnded) {
+        return; // Commands settled by stop() have no client left to answer
+      }
+      if (!socket.writableCorked) {
+        socket.cork();
+        process.nextTick(() => socket.uncork());
+      }
+      socket.write(JSON.stringify(response) + '\n');
+    };
+
+    // Decode as a stream so multi-byte characters split across reads survive,
+    // and carry a partial trailing line over to the next read: TCP does not
+    // preserve the client's write boundaries
+    socket.setEncoding('utf8');
+    let partialLine = '';
+
+    socket.on('data', (data: string) => {
+      // Clients may batch several newline-delimited commands into one write
+      const lines = (partialLine + data).split('\n');
+      partialLine = lines.pop() ?? '';
+
+      for (const line of lines) {
+        const commandStr = line.trim();
+        if (!commandStr) continue;
+
+        let command: TCPCommand;
+        try {
+          command = JSON.parse(commandStr) as TCPCommand;
+        } catch (error) {
+          LogHelpers.error('tty-bridge', error as Error, { data: commandStr });
+          reply({
+            success: false,
+            message: 'Invalid command format',
+            timestamp: new Date()
+          });
+          continue;
+        }
+
+        // Bound the backlog of a client that pipelines faster than commands
+        // finish; the refusal skips the queue, so it echoes the sequenceId
+        if (pendingCommands >= MAX_PENDING_COMMANDS) {
+          reply({
+            success: false,
+            message: 'Command queue full',
+            timestamp: new Date(),
+            sequenceId: command.sequenceId
+          });
+          continue;
+        }
+
+        pendingCommands++;
+        commandQueue = commandQueue
+          .then(() => this.sendCommand(command))
+          .then(reply)
           .catch((error) => {
-            const errorResponse: TCPResponse = {
+            reply({
               success: false,
               message: error.message,
-              timestamp: new Date()
-            };
-            socket.write(JSON.stringify(errorResponse) + '\n');
+              timestamp: new Date(),
+              sequenceId: command.sequenceId
+            });
+          })
+          .finally(() => {
+            pendingCommands--;
           });
-      } catch (error) {
-        LogHelpers.error('tty-bridge', error as Error, { data: data.toString() });
-        const errorResponse: TCPResponse = {
-          success: false,
-          message: 'Invalid command format',
-          timestamp: new Date()
-        };
-        socket.write(JSON.stringify(errorResponse) + '\n');
       }
     });
 
@@ -438,6 +537,10 @@ export class TTYBridge extends EventEmitter {
         case 'enter':
           input = '\n';
           break;
+        case 'submit':
+          // Text and Enter in one stdin write instead of two round trips
+          input = (command.content || '') + '\n';
+          break;
         case 'up':
           input = '\u001b[A'; // Up arrow
           break;
@@ -465,7 +568,7 @@ export class TTYBridge extends EventEmitter {
           return {
             success: true,
             data: {
-              processAlive: !this.claudeProcess.killed,
+              processAlive: !this.claudeProcess.killed && !this.hasClaudeExited(),
               clientCount: this.clients.size,
               isListening: this.isListening
             },
@@ -513,12 +616,18 @@ export async function findAvailablePort(startPort: number = 9999, endPort: numbe
   const { createServer } = await import('net');
   
   for (let port = startPort; port <= endPort; port++) {
-    const available = await new Promise<boolean>((resolve) => {
+    const available = await new Promise<boolean>((resolve, reject) => {
       const server = createServer();
       server.listen(port, 'localhost', () => {
         server.close(() => resolve(true));
       });
-      server.on('error', () => resolve(false));
+      server.on('error', (error: NodeJS.ErrnoException) => {
+        if (isPortUnavailableError(error)) {
+          resolve(false);
+        } else {
+          reject(error);
+        }
+      });
     });
     
     if (available) {
@@ -64,7 +64,9 @@ export const TCPCommandTypeSchema = z.enum([
   'tab',
   'raw',
   'status',
-  'ping'
+  'ping',
+  'sleep',
+  'submit'
 ]);
 
 export type TCPCommandType = z.infer<typeof TCPCommandTypeSchema>;
@@ -0,0 +1,32 @@
+/**
+ * Shared socket settings for the TTY bridge and TCP command servers
+ *
+ * Both servers exchange small newline-delimited request/response frames with
+ * long-lived local clients, so they configure sockets and probe ports alike.
+ */
+
+import { Socket } from 'net';
+
+// Idle time before the first keep-alive probe on a client connection
+export const CLIENT_KEEPALIVE_MS = 10000;
+
+/**
+ * Apply the socket options every accepted command client needs
+ */
+export function configureClientSocket(socket: Socket): void {
+  // Commands and replies are small request/response frames; disable Nagle
+  // so they are not held back waiting on the peer's delayed ACK
+  socket.setNoDelay(true);
+  // Probe idle peers so a client that vanished without a FIN is detected
+  // and dropped instead of lingering half-open
+  socket.setKeepAlive(true, CLIENT_KEEPALIVE_MS);
+}
+
+/**
+ * Whether a listen error only rules out this port. A taken or privileged port
+ * moves a port scan on; any other errno (e.g. loopback not bindable) would
+ * fail every port in the range, so it should surface instead
+ */
+export function isPortUnavailableError(error: NodeJS.ErrnoException): boolean {
+  return error.code === 'EADDRINUSE' || error.code === 'EACCES';
+}
@@ -0,0 +1,42 @@
+/**
+ * PATH lookup for executables
+ *
+ * Resolves a command name the way a shell would, with one X_OK access check
+ * per PATH entry instead of spawning `which` or the command itself.
+ */
+
+import { promises as fs } from 'fs';
+import * as path from 'path';
+
+// Last PATH lookup per executable name, reused while PATH is unchanged and the
+// binary still passes an X_OK check
+const pathLookupCache = new Map<string, { searchPath: string; resolved: string }>();
+
+/**
+ * Return the first PATH entry containing an executable with this name
+ */
+export async function findOnPath(name: string): Promise<string | null> {
+  const searchPath = process.env.PATH || '';
+  const cached = pathLookupCache.get(name);
+  if (cached && cached.searchPath === searchPath) {
+    try {
+      await fs.access(cached.resolved, fs.constants.X_OK);
+      return cached.resolved;
+    } catch {
+      pathLookupCache.delete(name); // Removed or replaced; search again
+    }
+  }
+
+  for (const dir of searchPath.split(path.delimiter)) {
+    if (!dir) continue;
+    const candidate = path.join(dir, name);
+    try {
+      await fs.access(candidate, fs.constants.X_OK);
+      pathLookupCache.set(name, { searchPath, resolved: candidate });
+      return candidate;
+    } catch {
+      // Missing or not executable here
+    }
+  }
+  return null;
+}
@@ -52,6 +52,10 @@ export interface LoggerConfig {
   enableFileRotation?: boolean;
 }
 
+// Log directories already created in this process, so re-initializing a
+// logger does not repeat the existence check and mkdir syscalls
+const ensuredLogDirectories = new Set<string>();
+
 /**
  * Main structured logger class for Claude Monitor
  */
@@ -85,11 +89,14 @@ export class MonitorLogger {
 
   private ensureLogDirectory(): void {
     if (this.config.file || this.config.standaloneMode) {
-      const logDir = this.config.logDirectory!;
+      const logDir = path.resolve(this.config.logDirectory!);
+      if (ensuredLogDirectories.has(logDir)) {
+        return;
+      }
       try {
-        if (!fs.existsSync(logDir)) {
-          fs.mkdirSync(logDir, { recursive: true });
-        }
+        // recursive mkdir is a no-op for existing directories
+        fs.mkdirSync(logDir, { recursive: true });
+        ensuredLogDirectories.add(logDir);
       } catch (error) {
         console.warn(`Failed to create log directory ${logDir}:`, error);
         // Fallback to current directory
@@ -173,6 +180,13 @@ export class MonitorLogger {
     return logger;
   }
 
+  /**
+   * Check whether a level would be emitted, so callers can skip building payloads
+   */
+  isLevelEnabled(level: LoggerConfig['level']): boolean {
+    return this.rootLogger.isLevelEnabled(level);
+  }
+
   /**
    * Get a component-specific logger
    */
@@ -200,6 +214,8 @@ export class MonitorLogger {
     context?: string[],
     confidence: number = 0.0
   ): void {
+    if (!this.isLevelEnabled('info')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.info({
@@ -250,6 +266,8 @@ export class MonitorLogger {
     componentName: string,
     taskStatus: TaskStatusContext
   ): void {
+    if (!this.isLevelEnabled('info')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.info({
@@ -299,6 +317,8 @@ export class MonitorLogger {
     componentName: string,
     metric: PerformanceMetric
   ): void {
+    if (!this.isLevelEnabled('info')) return;
+
     const logger = this.getLogger(componentName);
     
     let message = `Performance metric ${metric.metric_name}: ${metric.value}`;
@@ -327,6 +347,8 @@ export class MonitorLogger {
     description: string,
     context?: Record<string, unknown>
   ): void {
+    if (!this.isLevelEnabled('info')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.info({
@@ -345,6 +367,8 @@ export class MonitorLogger {
     message: string,
     context?: Record<string, unknown>
   ): void {
+    if (!this.isLevelEnabled('debug')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.debug({
@@ -362,6 +386,8 @@ export class MonitorLogger {
     message: string,
     context?: Record<string, unknown>
   ): void {
+    if (!this.isLevelEnabled('info')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.info({
@@ -379,6 +405,8 @@ export class MonitorLogger {
     message: string,
     context?: Record<string, unknown>
   ): void {
+    if (!this.isLevelEnabled('warn')) return;
+
     const logger = this.getLogger(componentName);
     
     logger.warn({
@@ -528,7 +556,10 @@ export const LogHelpers = {
     getGlobalLogger().logInfo(component, message, context),
 
   warning: (component: string, message: string, context?: Record<string, unknown>) =>
-    getGlobalLogger().logWarning(component, message, context)
+    getGlobalLogger().logWarning(component, message, context),
+
+  isLevelEnabled: (level: LoggerConfig['level']) =>
+    getGlobalLogger().isLevelEnabled(level)
 };
 
 export default MonitorLogger;
\ No newline at end of file
@@ -497,58 +497,47 @@ function validateRequest(request: NextRequest): { valid: boolean; error?: string
   }
 }
 
+// Route tables consulted on every request, built once at module load
+const PUBLIC_PATH_PREFIXES = ['/api/health', '/api/auth/login', '/api/setup', '/login', '/_next', '/favicon.ico'];
+
+// Main UI pages; a route also covers its sub-paths (e.g. /sessions/[id])
+const ROUTE_DISPLAY_NAMES: ReadonlyMap<string, string> = new Map([
+  ['/', 'Dashboard'],
+  ['/dashboard', 'Dashboard'],
+  ['/performance', 'Performance Monitoring'],
+  ['/projects', 'Project Management'],
+  ['/sessions', 'Session Monitoring'],
+  ['/recovery', 'Recovery Operations'],
+  ['/settings', 'Settings']
+]);
+
+/**
+ * Reduce a pathname to its first segment, so '/sessions/abc' -> '/sessions'
+ */
+function topLevelRoute(pathname: string): string {
+  const slash = pathname.indexOf('/', 1);
+  return slash === -1 ? pathname : pathname.slice(0, slash);
+}
+
 /**
  * Get friendly route name for better UX context
  */
 function getRouteDisplayName(pathname: string): string {
-  const routeNames: Record<string, string> = {
-    '/': 'Dashboard',
-    '/dashboard': 'Dashboard',
-    '/performance': 'Performance Monitoring',
-    '/projects': 'Project Management',
-    '/sessions': 'Session Monitoring',
-    '/recovery': 'Recovery Operations',
-    '/settings': 'Settings'
-  };
-  
-  // Handle dynamic routes like /sessions/[id]
-  for (const [route, name] of Object.entries(routeNames)) {
-    if (pathname === route || pathname.startsWith(route + '/')) {
-      return name;
-    }
-  }
-  
-  return 'Application';
+  return ROUTE_DISPLAY_NAMES.get(topLevelRoute(pathname)) ?? 'Application';
 }
 
 /**
  * Check if the request requires authentication
  */
 function requiresAuth(pathname: string): boolean {
-  const publicPaths = ['/api/health', '/api/auth/login', '/api/setup', '/login'];
-  const staticPaths = ['/_next', '/favicon.ico'];
-  
   // Allow public paths and static assets (including setup API)
-  if (publicPaths.some(path => pathname.startsWith(path)) ||
-      staticPaths.some(path => pathname.startsWith(path))) {
+  if (PUBLIC_PATH_PREFIXES.some(path => pathname.startsWith(path))) {
     return false;
   }
   
-  // Protected application routes - all main UI pages require authentication
-  const protectedRoutes = [
-    '/',
-    '/dashboard',
-    '/performance', 
-    '/projects',
-    '/sessions',
-    '/recovery',
-    '/settings'
-  ];
-  
-  // Check if pathname exactly matches or starts with a protected route
-  const isProtectedRoute = protectedRoutes.some(route => 
-    pathname === route || pathname.startsWith(route + '/')
-  );
+  // Protected application routes - all main UI pages require authentication,
+  // matched exactly or as a parent of the requested path
+  const isProtectedRoute = ROUTE_DISPLAY_NAMES.has(topLevelRoute(pathname));
   
   // Require auth for protected routes and API routes (except public ones)
   return isProtectedRoute || pathname.startsWith('/api');
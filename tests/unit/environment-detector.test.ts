@@ -15,7 +15,7 @@
  */
 
 import { promises as fs } from 'fs';
-import { existsSync } from 'fs';
+import { existsSync, readdirSync } from 'fs';
 import { hostname } from 'os';
 import environmentDetector, {
   detectEnvironment,
@@ -35,6 +35,7 @@ jest.mock('fs', () => ({
     readFile: jest.fn(),
   },
   existsSync: jest.fn(),
+  readdirSync: jest.fn(),
 }));
 
 jest.mock('os', () => ({
@@ -48,6 +49,7 @@ describe.skip('EnvironmentDetector', () => {
   // Get mocked functions
   const mockReadFile = fs.readFile as jest.MockedFunction<typeof fs.readFile>;
   const mockExistsSync = existsSync as jest.MockedFunction<typeof existsSync>;
+  const mockReaddirSync = readdirSync as jest.Mock;
   const mockHostname = hostname as jest.MockedFunction<typeof hostname>;
 
   beforeEach(() => {
@@ -62,6 +64,11 @@ describe.skip('EnvironmentDetector', () => {
     
     // Set default mock behaviors
     mockExistsSync.mockReturnValue(false);
+    // Working-directory listings follow whatever mockExistsSync reports
+    mockReaddirSync.mockImplementation(() =>
+      ['package.json', 'package-lock.json', 'yarn.lock', '.env.local', '.env.development', 'node_modules', '.git', 'data']
+        .filter(name => mockExistsSync(name))
+    );
     mockHostname.mockReturnValue('localhost');
     mockReadFile.mockRejectedValue(new Error('File not found'));
   });
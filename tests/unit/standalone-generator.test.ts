@@ -46,7 +46,9 @@ const mockWriteFile = jest.fn();
 const mockReadFile = jest.fn();
 const mockMkdir = jest.fn();
 const mockUnlink = jest.fn();
+const mockStat = jest.fn();
 const mockExistsSync = jest.fn();
+const mockStatSync = jest.fn();
 
 jest.mock('fs', () => ({
   promises: {
@@ -54,8 +56,10 @@ jest.mock('fs', () => ({
     readFile: mockReadFile,
     mkdir: mockMkdir,
     unlink: mockUnlink,
+    stat: mockStat,
   },
   existsSync: mockExistsSync,
+  statSync: mockStatSync,
 }));
 const { getConfig, ConfigurationError } = jest.requireMock('../../lib/config/settings');
 
@@ -82,6 +86,11 @@ describe.skip('StandaloneConfigGenerator', () => {
     mockReadFile.mockResolvedValue('');
     mockMkdir.mockResolvedValue(undefined);
     mockUnlink.mockResolvedValue(undefined);
+    mockStat.mockResolvedValue({ mtimeMs: Date.now(), size: 0, isDirectory: () => false });
+    // Existence is driven by mockExistsSync; statSync mirrors it so both agree
+    mockStatSync.mockImplementation((filePath: string) =>
+      mockExistsSync(filePath) ? { mtimeMs: Date.now(), size: 0 } : undefined
+    );
     getConfig.mockReturnValue({});
 
     // Mock console.log to suppress output during tests